@@ -7,15 +7,318 @@ providing a unified interface for building, testing, and maintaining the project
 """
 
 import argparse
+import bisect
 import sys
 import os
+import glob
+import itertools
+import json
+import math
+import mmap
+import hashlib
+import io
+import pickle
+import queue
 import platform
+import re
+import shlex
 import subprocess
 import shutil
+import stat
+import xml.etree.ElementTree as ET
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Callable, Iterable, List, Optional, Dict, Mapping, TextIO
 import logging
+import logging.handlers
+import atexit
+import collections
+import functools
+import operator
 import time
+import types
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Optional; the standard library json module is used when it isn't installed
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional; compile_commands.json is loaded whole when it isn't installed
+    ijson = None
+
+
+# Single source for parallelism settings across build, format and lint
+_CPU_COUNT = os.cpu_count() or 1
+
+
+def _default_lint_jobs() -> int:
+    """Concurrent clang-tidy processes to run by default: one per core, at most one per 2 GB free.
+    
+    Large translation units can take over a gigabyte each, so a core count alone can run a
+    machine out of memory. The limit is skipped where available memory can't be queried.
+    """
+    try:
+        free_bytes = os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return _CPU_COUNT
+    return max(1, min(_CPU_COUNT, free_bytes // (2 << 30)))
+
+
+def _read_json_file(path: Path):
+    """Parse a JSON file, using orjson when available."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _write_json_file(path: Path, obj, indent: bool = False) -> None:
+    """Write obj as JSON, compact or indented by two spaces, using orjson when available."""
+    if orjson:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    elif indent:
+        data = json.dumps(obj, indent=2).encode('utf-8')
+    else:
+        data = json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+# Suppressed-warning and header-filter messages that clang-tidy prints alongside diagnostics
+_CLANG_TIDY_NOISE_RE = re.compile(r'^\s*Suppressed|Use -header-filter=|warnings generated')
+
+# One clang-tidy diagnostic: "file:line:col: severity: message [check]". The file is matched lazily
+# so Windows drive letters stay part of it; rest is everything after the column, as reported.
+_DIAG_RE = re.compile(r'^\s*(.+?):(\d+):(\d+):\s*((fatal error|error|warning|note):.*?(?:\[([^\[\]]+)\])?)\s*$')
+# Summary clang-tidy prints after --fix; FIX-IT notes are counted too in case it is missing
+_APPLIED_FIXES_RE = re.compile(r'clang-tidy applied (\d+) of \d+ suggested fixes')
+_SEVERITY_COUNT_KEYS = {'error': 'error_count', 'warning': 'warning_count', 'note': 'note_count'}
+_SEVERITY_TAGS = {'error': '[ERROR]', 'warning': '[WARN]', 'note': '[NOTE]'}
+# "file" entry in a clang-tidy profile; on Windows its path has unescaped backslashes
+_PROFILE_FILE_RE = re.compile(rb'"file":\s*"([^"]*)"')
+
+# "[timestamp pid] Source file: ..." and "[timestamp pid] Result: ..." lines in a CCACHE_LOGFILE
+_CCACHE_LOG_RE = re.compile(r'^\[\S+ (\d+)\s*\] (Source file|Result): (.+)$')
+
+# CTest summary lines, e.g. "100% tests passed, 0 tests failed out of 3",
+# "Total Test time (real) =   0.02 sec" and "1/3 Test #1: Dosatsu_SelfTest .... Passed 0.01 sec"
+_CTEST_PASSED_RE = re.compile(r'(\d+)% tests passed, (\d+) tests failed out of (\d+)')
+_CTEST_TOTAL_TIME_RE = re.compile(r'Total Test time.*?=\s*([0-9.]+)')
+_CTEST_RESULT_RE = re.compile(r'(\d+)/(\d+) Test #(\d+):\s*(\S+)\s*\.+\s*(\w+)\s*([0-9.]+)')
+# First characters of those lines; anything else ("    Start 1: ...", banners) is skipped outright
+_CTEST_LINE_STARTS = frozenset('0123456789T')
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_platform() -> Mapping[str, str]:
+    """Detect platform and set platform-specific configurations.
+    
+    The platform can't change while the process runs, so detection happens once and the
+    result is shared read-only by every orchestrator.
+    """
+    system = platform.system().lower()
+    platform_info = {
+        'system': system,
+        'architecture': platform.machine(),
+        'executable_ext': '',
+        'library_ext': '',
+        'shared_library_ext': '',
+    }
+    
+    if system == 'windows':
+        platform_info.update({
+            'executable_ext': '.exe',
+            'library_ext': '.lib',
+            'shared_library_ext': '.dll',
+            'preferred_generator': 'Ninja',
+            'default_compiler': 'MSVC',
+        })
+    elif system == 'linux':
+        platform_info.update({
+            'executable_ext': '',
+            'library_ext': '.a',
+            'shared_library_ext': '.so',
+            'preferred_generator': 'Ninja',
+            'default_compiler': 'GCC',
+        })
+    elif system == 'darwin':
+        platform_info.update({
+            'executable_ext': '',
+            'library_ext': '.a',
+            'shared_library_ext': '.dylib',
+            'preferred_generator': 'Ninja',
+            'default_compiler': 'Clang',
+        })
+        
+    return types.MappingProxyType(platform_info)
+
+
+@functools.lru_cache(maxsize=64)
+def _which_cached(tool_name: str, system: str) -> Optional[str]:
+    """Search PATH for a tool, memoized since PATH doesn't change during a run."""
+    # Platform-specific tool name variations
+    tool_variants = [tool_name]
+    
+    if system == 'windows':
+        if not tool_name.endswith('.exe'):
+            tool_variants.append(tool_name + '.exe')
+            
+    for variant in tool_variants:
+        tool_path = shutil.which(variant)
+        if tool_path:
+            return tool_path
+            
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_slow_checks(path: str, mtime_ns: int) -> tuple:
+    """Parse a slow-checks file; keyed on mtime so edits are picked up."""
+    slow_checks = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            # Skip empty lines and comments
+            if line and not line.startswith('#'):
+                slow_checks.append(line)
+    return tuple(slow_checks)
+
+
+@functools.lru_cache(maxsize=8)
+def _slow_checks_arg(path: str, mtime_ns: int) -> Optional[str]:
+    """The -checks= argument disabling every check in a slow-checks file, or None if it lists none."""
+    slow_checks = _parse_slow_checks(path, mtime_ns)
+    return f"-checks={','.join(f'-{check}' for check in slow_checks)}" if slow_checks else None
+
+
+def _read_profile_timings(path: str) -> Dict[str, float]:
+    """Per-check wall time in seconds from one clang-tidy --store-check-profile file."""
+    with open(path, 'rb') as f:
+        content = f.read()
+    # Fix Windows path escaping in JSON - double backslashes in paths
+    # Replace single backslashes in file paths with double backslashes.
+    # orjson is just as strict about raw backslashes, so this stays either way.
+    if b'\\' in content:
+        content = _PROFILE_FILE_RE.sub(
+            lambda m: b'"file": "' + m.group(1).replace(b'\\', b'\\\\') + b'"', content)
+    # A lint run can leave hundreds of these; orjson parses them several times faster
+    profile_data = orjson.loads(content) if orjson else json.loads(content)
+    
+    timings = {}
+    if 'profile' in profile_data:
+        for key, value in profile_data['profile'].items():
+            # Parse timing keys like "time.clang-tidy.bugprone-sizeof-expression.wall"
+            if key.startswith('time.clang-tidy.') and key.endswith('.wall'):
+                timings[key[len('time.clang-tidy.'):-len('.wall')]] = float(value)
+    return timings
+
+
+# Extensions counted as C++ sources and headers in compile-db statistics
+_CPP_SOURCE_EXTS = ('.cpp', '.cc', '.cxx')
+_CPP_HEADER_EXTS = ('.h', '.hpp', '.hh')
+
+# Arguments shown in concise command output; a single tuple keeps the check to one endswith call
+_SOURCE_EXTS = ('.cpp', '.cxx', '.cc', '.hpp', '.h', '.hxx')
+
+# Compiler flags dropped when turning a compile command into a preprocessing one: outputs and
+# dependency files would overwrite the build's own, and -c conflicts with -E
+_COMPILE_ONLY_FLAGS = frozenset(('-c', '-MD', '-MMD'))
+_COMPILE_ONLY_FLAGS_WITH_VALUE = frozenset(('-o', '-MF', '-MT', '-MQ'))
+# Clang options that merely begin with -o; anything else starting with it is a joined -o<path>
+_NOT_JOINED_OUTPUT_FLAGS = ('-objcmt-', '-object')
+
+# Clean lint results older than this are pruned from the preprocessed-source result store
+_LINT_RESULT_MAX_AGE = 30 * 24 * 60 * 60
+
+
+@functools.lru_cache(maxsize=2)
+def _load_compdb(path: str, mtime_ns: int, windows: bool) -> Dict[str, tuple]:
+    """Index a compile_commands.json by real source path as (directory, argument tuple).
+    
+    Commands are split once here so lookups don't re-run shlex. mtime_ns is part of the cache
+    key so a regenerated database is reloaded.
+    """
+    compdb = {}
+    for entry in _read_json_file(Path(path)):
+        if not isinstance(entry, dict):
+            continue
+        directory = entry.get('directory', '')
+        args = entry.get('arguments')
+        if not args:
+            args = shlex.split(entry.get('command', ''), posix=not windows)
+            if windows:
+                args = [arg[1:-1] if len(arg) > 1 and arg[0] == arg[-1] == '"' else arg for arg in args]
+        source = os.path.normcase(os.path.realpath(os.path.join(directory, entry.get('file', ''))))
+        compdb[source] = (directory, tuple(args))
+    return compdb
+
+
+def _is_joined_compile_only_flag(arg: str) -> bool:
+    """Whether arg is one of the value-taking compile-only flags with its value attached, e.g. -o<path>."""
+    for flag in _COMPILE_ONLY_FLAGS_WITH_VALUE:
+        if len(arg) > len(flag) and arg.startswith(flag):
+            return flag != '-o' or not arg.startswith(_NOT_JOINED_OUTPUT_FLAGS)
+    return False
+
+
+def _preprocess_command(args: tuple) -> Optional[List[str]]:
+    """Turn compile command arguments into a command printing the preprocessed source.
+    
+    Returns None for MSVC-style drivers, whose flags don't follow the GCC/Clang conventions.
+    """
+    if not args or Path(args[0]).stem.lower() in ('cl', 'clang-cl'):
+        return None
+        
+    command = [args[0]]
+    skip_value = False
+    for arg in args[1:]:
+        if skip_value:
+            skip_value = False
+        elif arg in _COMPILE_ONLY_FLAGS_WITH_VALUE:
+            skip_value = True
+        elif arg not in _COMPILE_ONLY_FLAGS and not _is_joined_compile_only_flag(arg):
+            command.append(arg)
+    return command + ['-E', '-P', '-o', '-']
+
+
+# MSVC runtime library per build type, passed to CMake when configuring on Windows
+_CMAKE_WINDOWS_RTLIB = {
+    "Debug": "-DCMAKE_MSVC_RUNTIME_LIBRARY=MultiThreadedDebugDLL",
+    "Release": "-DCMAKE_MSVC_RUNTIME_LIBRARY=MultiThreaded",
+}
+
+# Pre-commit hook installed by install-git-hooks
+_PRE_COMMIT_HOOK_SCRIPT = '''#!/bin/sh
+# Pre-commit hook for code formatting checks
+
+echo "Running pre-commit formatting checks..."
+
+# Get list of staged C++ files
+STAGED_FILES=$(git diff --cached --name-only --diff-filter=ACM | grep -E "\\.(cpp|h|hpp)$" || true)
+
+if [ -z "$STAGED_FILES" ]; then
+    echo "[OK] No C++ files to check"
+    exit 0
+fi
+
+echo "Checking formatting for staged C++ files..."
+
+# Run format check
+please format --check-only --files $STAGED_FILES
+
+if [ $? -ne 0 ]; then
+    echo "[ERROR] Code formatting issues found!"
+    echo "Run 'please format' to fix formatting issues"
+    echo "Then stage the corrected files and commit again"
+    exit 1
+fi
+
+echo "[OK] All staged files are properly formatted"
+exit 0
+'''
 
 
 class CleanLogger:
@@ -24,23 +327,48 @@ class CleanLogger:
     def __init__(self, file_logger):
         self.file_logger = file_logger
         
-    def info(self, message):
+    # Console output stays synchronous so it keeps its order relative to plain print() calls and
+    # to tools writing straight to the terminal; file logging is already queued (see setup_logging).
+    # Each message is a single write so lines from worker threads don't interleave.
+    
+    def info(self, message, *args):
         # Clean output to console
-        print(message)
+        sys.stdout.write((message % args if args else message) + '\n')
         # Full logging to file
-        self.file_logger.info(message)
+        self.file_logger.info(message, *args)
         
-    def warning(self, message):
-        print(f"WARNING: {message}")
-        self.file_logger.warning(message)
+    def warning(self, message, *args):
+        sys.stdout.write(f"WARNING: {message % args if args else message}\n")
+        self.file_logger.warning(message, *args)
         
-    def error(self, message):
-        print(f"ERROR: {message}")
-        self.file_logger.error(message)
+    def error(self, message, *args):
+        sys.stdout.write(f"ERROR: {message % args if args else message}\n")
+        self.file_logger.error(message, *args)
         
-    def debug(self, message):
-        # Debug only goes to file
-        self.file_logger.debug(message)
+    def debug(self, message, *args):
+        # Debug only goes to file; %-style args are only formatted if debug logging is enabled
+        self.file_logger.debug(message, *args)
+
+
+# The thread writing queued records to build.log. There is only ever one, since every
+# BuildOrchestrator logs through the same logger.
+_log_listener = None
+
+
+def _stop_log_listener():
+    """Stop the build.log listener thread, writing out every record it has queued or buffered."""
+    global _log_listener
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    for buffered_handler in _log_listener.handlers:
+        file_handler = buffered_handler.target
+        buffered_handler.close()
+        file_handler.close()
+    _log_listener = None
+
+
+atexit.register(_stop_log_listener)
 
 
 class BuildOrchestrator:
@@ -48,13 +376,22 @@ class BuildOrchestrator:
     
     def __init__(self):
         self.project_root = Path(__file__).parent.absolute()
+        self.project_root_str = str(self.project_root)
+        self._root_prefix = self.project_root_str + os.sep
         self.artifacts_dir = self.project_root / "artifacts"
-        self.platform_info = self._detect_platform()
+        self._build_dir_cache = {}
+        self.platform_info = _detect_platform()
+        # Resolved once so platform branches are an attribute load, not a lookup and string compare
+        system = self.platform_info['system']
+        self._is_windows = system == 'windows'
+        self._is_linux = system == 'linux'
+        self._is_darwin = system == 'darwin'
         self.start_time = None
         self.setup_logging()
         
     def setup_logging(self):
         """Configure logging with both console and file output."""
+        global _log_listener
         # Create logs directory if it doesn't exist
         log_dir = self.artifacts_dir / "debug" / "logs"
         log_dir.mkdir(parents=True, exist_ok=True)
@@ -63,15 +400,24 @@ class BuildOrchestrator:
         file_logger = logging.getLogger(f"{__name__}_file")
         file_logger.setLevel(logging.INFO)
         
-        # Remove any existing handlers
-        if file_logger.handlers:
-            file_logger.handlers.clear()
+        # Remove any existing handlers, then stop their listener so its records reach the old log
+        file_logger.handlers.clear()
+        _stop_log_listener()
             
         # Add file handler with timestamp format
         file_handler = logging.FileHandler(log_dir / "build.log")
         file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(file_formatter)
-        file_logger.addHandler(file_handler)
+        
+        # Buffer records so bursts of log lines don't each cost a write; errors flush immediately
+        buffered_handler = logging.handlers.MemoryHandler(capacity=512, flushLevel=logging.ERROR, target=file_handler)
+        
+        # QueueHandler still merges the message arguments on the calling thread, but buffering
+        # and file I/O happen on the listener thread
+        log_queue = queue.SimpleQueue()
+        _log_listener = logging.handlers.QueueListener(log_queue, buffered_handler)
+        _log_listener.start()
+        file_logger.addHandler(logging.handlers.QueueHandler(log_queue))
         
         # Use custom clean logger
         self.logger = CleanLogger(file_logger)
@@ -93,6 +439,10 @@ class BuildOrchestrator:
                 
     def make_relative_path(self, path):
         """Convert absolute path to relative path from project root."""
+        # Paths built from project_root share its exact prefix, so a string check avoids Path objects
+        path_str = os.fspath(path)
+        if path_str.startswith(self._root_prefix):
+            return path_str[len(self._root_prefix):]
         try:
             path_obj = Path(path)
             if path_obj.is_absolute() and path_obj.is_relative_to(self.project_root):
@@ -103,62 +453,25 @@ class BuildOrchestrator:
     
     def _read_slow_checks_file(self):
         """Read the list of slow clang-tidy checks from .slow-clang-tidy-checks file."""
-        slow_checks_file = self.project_root / ".slow-clang-tidy-checks"
-        slow_checks = []
+        return list(self._slow_checks_lookup(_parse_slow_checks) or ())
         
-        if slow_checks_file.exists():
-            try:
-                with open(slow_checks_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        # Skip empty lines and comments
-                        if line and not line.startswith('#'):
-                            slow_checks.append(line)
-            except Exception as e:
-                self.logger.warning(f"Failed to read {slow_checks_file}: {e}")
-                
-        return slow_checks
-        
-    def _detect_platform(self) -> Dict[str, str]:
-        """Detect platform and set platform-specific configurations."""
-        system = platform.system().lower()
-        platform_info = {
-            'system': system,
-            'architecture': platform.machine(),
-            'executable_ext': '',
-            'library_ext': '',
-            'shared_library_ext': '',
-        }
+    def _slow_checks_argument(self) -> Optional[str]:
+        """Return the -checks= argument that disables the slow checks, or None if there are none."""
+        return self._slow_checks_lookup(_slow_checks_arg)
+        
+    def _slow_checks_lookup(self, parse):
+        """Apply a (path, mtime_ns)-memoized parser to .slow-clang-tidy-checks; None if unreadable."""
+        slow_checks_file = self.project_root / ".slow-clang-tidy-checks"
         
-        if system == 'windows':
-            platform_info.update({
-                'executable_ext': '.exe',
-                'library_ext': '.lib',
-                'shared_library_ext': '.dll',
-                'preferred_generator': 'Ninja',
-                'default_compiler': 'MSVC',
-                'shell_cmd': ['cmd', '/c'],
-            })
-        elif system == 'linux':
-            platform_info.update({
-                'executable_ext': '',
-                'library_ext': '.a',
-                'shared_library_ext': '.so',
-                'preferred_generator': 'Ninja',
-                'default_compiler': 'GCC',
-                'shell_cmd': ['/bin/bash', '-c'],
-            })
-        elif system == 'darwin':
-            platform_info.update({
-                'executable_ext': '',
-                'library_ext': '.a',
-                'shared_library_ext': '.dylib',
-                'preferred_generator': 'Ninja',
-                'default_compiler': 'Clang',
-                'shell_cmd': ['/bin/bash', '-c'],
-            })
-            
-        return platform_info
+        try:
+            mtime_ns = slow_checks_file.stat().st_mtime_ns
+        except OSError:
+            return None
+        try:
+            return parse(str(slow_checks_file), mtime_ns)
+        except Exception as e:
+            self.logger.warning(f"Failed to read {slow_checks_file}: {e}")
+            return None
         
     def get_executable_name(self, base_name: str) -> str:
         """Get platform-specific executable name."""
@@ -166,34 +479,22 @@ class BuildOrchestrator:
         
     def find_tool(self, tool_name: str) -> Optional[Path]:
         """Find a tool in the system PATH with platform-specific handling."""
-        # Platform-specific tool name variations
-        tool_variants = [tool_name]
-        
-        if self.platform_info['system'] == 'windows':
-            if not tool_name.endswith('.exe'):
-                tool_variants.append(tool_name + '.exe')
-                
-        # Search in PATH
-        for variant in tool_variants:
-            tool_path = shutil.which(variant)
-            if tool_path:
-                return Path(tool_path)
-                
-        return None
+        tool_path = _which_cached(tool_name, self.platform_info['system'])
+        return Path(tool_path) if tool_path else None
         
     def validate_environment(self):
         """Validate that the build environment is properly set up."""
         self.logger.info("Validating build environment...")
         
         # Check platform
-        system = platform.system().lower()
+        system = self.platform_info['system']
         self.logger.info(f"Platform: {system}")
         
-        if system == "windows":
+        if self._is_windows:
             self.logger.info("[OK] Windows platform detected")
-        elif system == "linux":
+        elif self._is_linux:
             self.logger.info("[OK] Linux platform detected")
-        elif system == "darwin":
+        elif self._is_darwin:
             self.logger.info("[OK] macOS platform detected")
         else:
             self.logger.error(f"[ERROR] Unsupported platform: {system}")
@@ -210,9 +511,12 @@ class BuildOrchestrator:
         return True
         
     def run_command(self, cmd: List[str], cwd: Optional[Path] = None, capture_output: bool = False, 
-                   shell: bool = False, env: Optional[Dict[str, str]] = None, 
+                   env: Optional[Dict[str, str]] = None, 
                    silent: bool = False, concise: bool = False) -> subprocess.CompletedProcess:
-        """Run a command with proper logging and error handling."""
+        """Run a command with proper logging and error handling.
+        
+        The command is always executed directly from its argument list, never through a shell.
+        """
         if cwd is None:
             cwd = self.project_root
             
@@ -221,66 +525,141 @@ class BuildOrchestrator:
         
         if not silent:
             if concise:
-                # Show condensed command - just executable name and files
-                exe_path = Path(cmd_str[0])
-                exe_name = exe_path.stem  # Gets filename without extension
-                
-                # Extract just the source files (not flags/options)
-                source_files = []
-                for part in cmd_str[1:]:
-                    if not part.startswith('-') and (part.endswith('.cpp') or part.endswith('.h') or part.endswith('.hpp')):
-                        source_files.append(self.make_relative_path(part))
-                
-                if source_files:
-                    print(f"{exe_name} {' '.join(source_files)}")
-                else:
-                    print(exe_name)
+                # One write, so lines from concurrent jobs don't interleave
+                sys.stdout.write(self._describe_command(cmd_str) + '\n')
             else:
-                self.logger.info(f"Running: {' '.join(cmd_str)}")
-                self.logger.info(f"Working directory: {cwd}")
+                self.logger.info("Running: %s", ' '.join(cmd_str))
+                self.logger.info("Working directory: %s", cwd)
         
-        # Set up environment
-        run_env = os.environ.copy()
-        if env:
-            run_env.update(env)
+        # Only build a new environment when overriding; None makes the child inherit ours
+        run_env = {**os.environ, **env} if env else None
             
+        spawn_cmd, spawn_options = self._spawn_args(cmd_str, cwd)
         try:
-            # Platform-specific command execution
-            if shell and self.platform_info['system'] == 'windows':
-                # On Windows, use cmd /c for shell commands
-                full_cmd = ['cmd', '/c'] + cmd_str
-            elif shell and self.platform_info['system'] in ['linux', 'darwin']:
-                # On Unix-like systems, use bash -c
-                full_cmd = ['/bin/bash', '-c', ' '.join(cmd_str)]
-            else:
-                full_cmd = cmd_str
-                
             if capture_output:
-                result = subprocess.run(full_cmd, cwd=cwd, capture_output=True, text=True, 
-                                      check=False, env=run_env, shell=shell)
+                result = subprocess.run(spawn_cmd, capture_output=True, text=True, 
+                                      check=False, env=run_env, **spawn_options)
             else:
-                result = subprocess.run(full_cmd, cwd=cwd, check=False, env=run_env, shell=shell)
+                result = subprocess.run(spawn_cmd, check=False, env=run_env, **spawn_options)
                 
             if result.returncode != 0:
-                self.logger.error(f"Command failed with return code {result.returncode}")
+                self.logger.error("Command failed with return code %s", result.returncode)
                 if capture_output and result.stderr:
-                    self.logger.error(f"Error output: {result.stderr}")
+                    self.logger.error("Error output: %s", result.stderr)
             elif not concise:
                 self.logger.info("Command completed successfully")
                 
             return result
         except FileNotFoundError:
-            self.logger.error(f"Command not found: {cmd_str[0]}")
+            self.logger.error("Command not found: %s", cmd_str[0])
             raise
         except Exception as e:
-            self.logger.error(f"Unexpected error running command: {e}")
+            self.logger.error("Unexpected error running command: %s", e)
             raise
             
+    def _describe_command(self, cmd_str: List[str]) -> str:
+        """Condensed form of a command: the executable name and the source files it operates on."""
+        exe_name = Path(cmd_str[0]).stem  # Gets filename without extension
+        
+        # Extract just the source files (not flags/options)
+        source_files = [self.make_relative_path(part) for part in cmd_str[1:]
+                        if part[:1] != '-' and part.endswith(_SOURCE_EXTS)]
+        return f"{exe_name} {' '.join(source_files)}" if source_files else exe_name
+        
+    def _spawn_args(self, cmd_str: List[str], cwd: Optional[Path]):
+        """Return the command and Popen options that let CPython launch it with posix_spawn.
+        
+        subprocess only uses posix_spawn instead of fork+exec when the executable is a path,
+        cwd is None, close_fds is False and no preexec_fn is set. Descriptors this script opens
+        are non-inheritable (PEP 446), so leaving close_fds off passes nothing extra to the child.
+        """
+        if self._is_windows:
+            return cmd_str, {'cwd': cwd}
+        if not os.path.dirname(cmd_str[0]):
+            resolved = _which_cached(cmd_str[0], self.platform_info['system'])
+            if resolved:
+                cmd_str = [resolved] + cmd_str[1:]
+        if cwd is not None and os.path.abspath(cwd) == os.getcwd():
+            cwd = None
+        return cmd_str, {'cwd': cwd, 'close_fds': False}
+        
+    def _stream_command(self, cmd: List[str], sink: Optional[TextIO], lock: Optional[threading.Lock] = None,
+                        silent: bool = False, collect: bool = True,
+                        line_transform: Optional[Callable[[str], Optional[str]]] = None) -> subprocess.CompletedProcess:
+        """Run a command, writing its combined output to sink line by line as it is produced.
+        
+        The output is also returned in the result's stdout for later analysis unless collect is
+        False, in which case stdout is None and memory use stays flat. With no sink it is only
+        collected. line_transform, when given, maps each line to the text written to the sink, or to
+        None to leave the line out.
+        """
+        cmd_str = [str(c) for c in cmd]
+        if not silent:
+            # One write, so lines from concurrent jobs don't interleave
+            sys.stdout.write(self._describe_command(cmd_str) + '\n')
+        
+        lines = []
+        spawn_cmd, spawn_options = self._spawn_args(cmd_str, self.project_root)
+        try:
+            with subprocess.Popen(spawn_cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                  text=True, bufsize=1, **spawn_options) as process:
+                for line in process.stdout:
+                    if collect:
+                        lines.append(line)
+                    if sink is None:
+                        continue
+                    text = line_transform(line) if line_transform else line
+                    if text is None:
+                        continue
+                    if lock:
+                        with lock:
+                            sink.write(text)
+                    else:
+                        sink.write(text)
+        except FileNotFoundError:
+            self.logger.error("Command not found: %s", cmd_str[0])
+            raise
+            
+        if process.returncode != 0:
+            self.logger.error("Command failed with return code %s", process.returncode)
+        return subprocess.CompletedProcess(cmd_str, process.returncode, ''.join(lines) if collect else None, None)
+        
+    def _run_chunked(self, cmd: List[str], files: List[Path], chunk_count: int, max_workers: int,
+                     capture_output: bool = False, stream_to: Optional[Path] = None) -> subprocess.CompletedProcess:
+        """Run a command over interleaved chunks of files in parallel and merge the results.
+        
+        With stream_to, output is captured and also appended to that file as each chunk produces it.
+        """
+        chunk_count = max(1, min(len(files), chunk_count))
+        chunks = [cmd + [str(f) for f in files[i::chunk_count]] for i in range(chunk_count)]
+        
+        # Announce every chunk in one write rather than a line per worker
+        sys.stdout.write(''.join(self._describe_command([str(c) for c in chunk]) + '\n' for chunk in chunks))
+        sys.stdout.flush()
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(chunk_count, max_workers))) as executor:
+            if stream_to:
+                lock = threading.Lock()
+                with open(stream_to, 'w', encoding='utf-8') as sink:
+                    results = list(executor.map(
+                        lambda chunk: self._stream_command(chunk, sink, lock, silent=True), chunks))
+            else:
+                results = list(executor.map(
+                    lambda chunk: self.run_command(chunk, capture_output=capture_output, silent=True, concise=True),
+                    chunks))
+            
+        # Report the first failure; output is concatenated in chunk order so logs stay deterministic
+        return subprocess.CompletedProcess(
+            cmd + [str(f) for f in files],
+            next((r.returncode for r in results if r.returncode != 0), 0),
+            ''.join(r.stdout or '' for r in results) or None,
+            ''.join(r.stderr or '' for r in results) or None)
+            
     def ensure_directory(self, path: Path) -> None:
         """Ensure a directory exists with proper error handling."""
         try:
             path.mkdir(parents=True, exist_ok=True)
-            self.logger.debug(f"Ensured directory exists: {path}")
+            self.logger.debug("Ensured directory exists: %s", path)
         except PermissionError:
             self.logger.error(f"Permission denied creating directory: {path}")
             raise
@@ -288,9 +667,228 @@ class BuildOrchestrator:
             self.logger.error(f"Failed to create directory {path}: {e}")
             raise
             
+    def _collect_sources(self, source_dir: Path, extensions: tuple) -> List[Path]:
+        """Collect files directly under source_dir matching any of the extensions in a single scan."""
+        if not source_dir.is_dir():
+            return []
+        with os.scandir(source_dir) as entries:
+            return sorted(Path(entry.path) for entry in entries
+                          if entry.name.endswith(extensions) and entry.is_file())
+            
+    def _hash_file(self, path: Path) -> str:
+        """Return the SHA-1 of a file's contents."""
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+            
+    def _cache_key(self, *parts) -> str:
+        """Build a cache key from strings and file contents (Path parts are hashed by content)."""
+        key = hashlib.sha1()
+        for part in parts:
+            key.update(str(part).encode('utf-8'))
+            if isinstance(part, Path) and part.is_file():
+                key.update(self._hash_file(part).encode('ascii'))
+            key.update(b'\0')
+        return key.hexdigest()
+        
+    def _load_clean_cache(self, cache_file: Path, cache_key: str) -> Dict[str, list]:
+        """Load the manifest of files that last passed a check, or {} if it is missing or stale."""
+        try:
+            data = _read_json_file(cache_file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('key') != cache_key:
+            return {}
+        return data.get('files', {})
+        
+    def _filter_changed_files(self, files: List[Path], cache: Dict[str, list],
+                              dependency_states: Optional[Dict[str, str]] = None) -> List[Path]:
+        """Return the files whose contents or dependencies differ from their cache entry.
+        
+        Entries are [mtime_ns, size, sha1, dependency_state].
+        """
+        changed = []
+        for file_path in files:
+            entry = cache.get(str(file_path))
+            dependency_state = dependency_states.get(str(file_path)) if dependency_states else None
+            try:
+                st = file_path.stat()
+            except OSError:
+                changed.append(file_path)
+                continue
+            if not entry or entry[3:] != [dependency_state]:
+                changed.append(file_path)
+                continue
+            if entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                continue
+            # Only hash when the timestamp moved; a touched but identical file is still clean
+            if entry[1] == st.st_size and entry[2] == self._hash_file(file_path):
+                entry[0] = st.st_mtime_ns
+                continue
+            changed.append(file_path)
+        return changed
+        
+    def _record_clean_files(self, cache_file: Path, cache_key: str, cache: Dict[str, list], files: List[Path],
+                            dependency_states: Optional[Dict[str, str]] = None) -> None:
+        """Record files as clean in the manifest and write it atomically."""
+        for file_path in files:
+            try:
+                st = file_path.stat()
+                dependency_state = dependency_states.get(str(file_path)) if dependency_states else None
+                cache[str(file_path)] = [st.st_mtime_ns, st.st_size, self._hash_file(file_path), dependency_state]
+            except OSError:
+                cache.pop(str(file_path), None)
+                
+        temp_file = cache_file.with_suffix('.tmp')
+        try:
+            _write_json_file(temp_file, {'key': cache_key, 'files': cache})
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            self.logger.warning(f"Failed to write cache {cache_file}: {e}")
+            
+    def _normalize_dependency_path(self, build_dir: Path, path: str) -> str:
+        """Normalize a dependency path so translation units can be matched to lint files."""
+        return os.path.normcase(os.path.normpath(os.path.join(build_dir, path)))
+        
+    def _load_lint_dependencies(self, build_dir: Path, deps_file: Path) -> Dict[str, List[str]]:
+        """Map each translation unit to the headers it includes, using ninja's dependency log.
+        
+        The parsed graph is persisted to deps_file and reused until .ninja_deps changes.
+        Returns {} when the build has no dependency information yet.
+        """
+        ninja_deps = build_dir / ".ninja_deps"
+        ninja_tool = self.find_tool("ninja")
+        if not ninja_tool or not ninja_deps.exists():
+            return {}
+            
+        deps_stamp = ninja_deps.stat().st_mtime_ns
+        try:
+            data = _read_json_file(deps_file)
+            if data.get('stamp') == deps_stamp:
+                return data['units']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+            
+        result = self.run_command([ninja_tool, "-C", build_dir, "-t", "deps"], capture_output=True, silent=True, concise=True)
+        if result.returncode != 0:
+            return {}
+            
+        # Output is one unindented line per target followed by its indented dependencies
+        groups = []
+        for line in result.stdout.splitlines():
+            if not line.strip():
+                continue
+            if line[0].isspace():
+                if groups:
+                    groups[-1].append(self._normalize_dependency_path(build_dir, line.strip()))
+            else:
+                groups.append([])
+                
+        units = {}
+        for deps in groups:
+            source = next((d for d in deps if d.endswith((".cpp", ".cc", ".cxx"))), None)
+            if source:
+                units[source] = [d for d in deps if d != source]
+                
+        try:
+            _write_json_file(deps_file, {'stamp': deps_stamp, 'units': units})
+        except OSError as e:
+            self.logger.warning(f"Failed to write dependency cache {deps_file}: {e}")
+        return units
+        
+    def _dependency_fingerprints(self, files: List[Path], units: Dict[str, List[str]]) -> Dict[str, str]:
+        """Fingerprint the headers each file includes.
+        
+        Files missing from the dependency graph fall back to the state of every header in source/.
+        """
+        stat_cache = {}
+        
+        def state(path: str) -> str:
+            if path not in stat_cache:
+                try:
+                    st = os.stat(path)
+                    stat_cache[path] = f"{path}:{st.st_mtime_ns}:{st.st_size}"
+                except OSError:
+                    stat_cache[path] = f"{path}:missing"
+            return stat_cache[path]
+            
+        def fingerprint(headers) -> str:
+            return hashlib.sha1('\n'.join(state(h) for h in headers).encode('utf-8')).hexdigest()
+            
+        fallback = None
+        fingerprints = {}
+        for file_path in files:
+            headers = units.get(os.path.normcase(os.path.normpath(str(file_path))))
+            if headers is None:
+                if fallback is None:
+                    fallback = fingerprint(str(h) for h in self._collect_sources(self.project_root / "source", (".h", ".hpp")))
+                fingerprints[str(file_path)] = fallback
+            else:
+                fingerprints[str(file_path)] = fingerprint(headers)
+        return fingerprints
+        
+    def _preprocessed_keys(self, files: List[Path], compile_commands: Path, compile_commands_mtime_ns: int,
+                           cache_key: str) -> Dict[str, str]:
+        """Key each file by cache_key, its own bytes and its preprocessed source.
+        
+        Unlike the manifest, these keys ignore timestamps and headers the file doesn't see, so a
+        clean result can be reused after a branch switch or an unrelated header edit. -E -P drops
+        comments and directives that checks read (NOLINT, #if 1, duplicate #include, macros), so
+        the file's raw bytes are part of the key too. Files without a usable compile command, or
+        that fail to preprocess or read, get no key.
+        """
+        try:
+            compdb = _load_compdb(str(compile_commands), compile_commands_mtime_ns, self._is_windows)
+        except (OSError, ValueError):
+            return {}
+        
+        def preprocessed_key(file_path: Path) -> Optional[str]:
+            directory, args = compdb.get(os.path.normcase(os.path.realpath(file_path)), (None, ()))
+            command = _preprocess_command(args)
+            if not command:
+                return None
+            spawn_cmd, spawn_options = self._spawn_args(command, directory or None)
+            try:
+                result = subprocess.run(spawn_cmd, capture_output=True, check=False, **spawn_options)
+            except OSError:
+                return None
+            if result.returncode != 0:
+                return None
+            try:
+                with open(file_path, 'rb') as f:
+                    source = f.read()
+            except OSError:
+                return None
+            # Length-prefixed so the source/preprocessed boundary can't shift between keys
+            digest = hashlib.sha256(cache_key.encode('ascii') + b'\0')
+            digest.update(b'%d\0' % len(source))
+            digest.update(source)
+            digest.update(result.stdout)
+            return digest.hexdigest()
+            
+        with ThreadPoolExecutor(max_workers=max(1, min(len(files), _default_lint_jobs()))) as executor:
+            keys = executor.map(preprocessed_key, files)
+            return {str(f): key for f, key in zip(files, keys) if key}
+        
+    def _store_clean_results(self, result_dir: Path, keys: List[str]) -> None:
+        """Record clean results by preprocessed-source key and prune ones unused for a long time."""
+        try:
+            result_dir.mkdir(parents=True, exist_ok=True)
+            for key in keys:
+                (result_dir / key).touch()
+            cutoff = time.time() - _LINT_RESULT_MAX_AGE
+            with os.scandir(result_dir) as it:
+                for entry in it:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+        except OSError as e:
+            self.logger.warning(f"Failed to update lint result store {result_dir}: {e}")
+        
     def get_build_directory(self, build_type: str = "debug") -> Path:
         """Get the build directory for a specific build type."""
-        return self.artifacts_dir / build_type.lower() / "build"
+        build_dir = self._build_dir_cache.get(build_type)
+        if build_dir is None:
+            build_dir = self._build_dir_cache[build_type] = self.artifacts_dir / build_type.lower() / "build"
+        return build_dir
         
     def get_output_directory(self, build_type: str = "debug", output_type: str = "bin") -> Path:
         """Get output directory for binaries, libraries, etc."""
@@ -304,15 +902,13 @@ class BuildOrchestrator:
             
         # Create artifact directories
         self.logger.info("Creating artifact directories...")
-        for build_type in ["debug", "release"]:
-            for subdir in ["build", "bin", "lib", "logs"]:
-                dir_path = self.artifacts_dir / build_type / subdir
-                dir_path.mkdir(parents=True, exist_ok=True)
-                self.logger.info(f"Created: {dir_path}")
-                
-        # Create other artifact directories
-        for subdir in ["lint", "format", "test"]:
-            dir_path = self.artifacts_dir / subdir
+        # Shallowest first so shared ancestors already exist and each mkdir stats only its leaf
+        dir_paths = sorted({self.artifacts_dir / build_type / subdir
+                            for build_type in ("debug", "release")
+                            for subdir in ("build", "bin", "lib", "logs")}
+                           | {self.artifacts_dir / subdir for subdir in ("lint", "format", "test")},
+                           key=lambda p: (len(p.parts), p))
+        for dir_path in dir_paths:
             dir_path.mkdir(parents=True, exist_ok=True)
             self.logger.info(f"Created: {dir_path}")
             
@@ -342,7 +938,7 @@ class BuildOrchestrator:
         core_tools = ["cmake", "ninja", "git"]
         compiler_tools = []
         
-        if self.platform_info['system'] == "windows":
+        if self._is_windows:
             compiler_tools = ["cl"]  # MSVC compiler
         else:
             compiler_tools = ["gcc", "g++", "clang", "clang++"]
@@ -350,28 +946,23 @@ class BuildOrchestrator:
         all_tools = core_tools + compiler_tools
             
         self.logger.info("Tool availability:")
-        for tool in all_tools:
-            tool_path = self.find_tool(tool)
-            if tool_path:
-                try:
-                    # Try to get version info
-                    version_args = ["--version"]
-                    if tool == "cl":  # MSVC compiler uses different syntax
-                        version_args = []
-                        
-                    result = subprocess.run([str(tool_path)] + version_args, 
-                                          capture_output=True, text=True, timeout=30)
-                    if result.returncode == 0:
-                        version_line = result.stdout.split('\n')[0].strip()
-                        if not version_line and result.stderr:
-                            version_line = result.stderr.split('\n')[0].strip()
-                        self.logger.info(f"  [OK] {tool}: {version_line} ({tool_path})")
-                    else:
-                        self.logger.info(f"  [OK] {tool}: found at {tool_path}")
-                except (subprocess.TimeoutExpired, Exception):
-                    self.logger.info(f"  [OK] {tool}: found at {tool_path}")
-            else:
+        tool_paths = [(tool, self.find_tool(tool)) for tool in all_tools]
+        found_tools = [(tool, tool_path) for tool, tool_path in tool_paths if tool_path]
+        
+        # Version probes are dominated by process startup, so run them concurrently
+        versions = {}
+        if found_tools:
+            with ThreadPoolExecutor(max_workers=len(found_tools)) as executor:
+                probes = executor.map(lambda item: self._probe_tool_version(*item), found_tools)
+                versions = dict(zip((tool for tool, _ in found_tools), probes))
+                
+        for tool, tool_path in tool_paths:
+            if not tool_path:
                 self.logger.info(f"  [MISSING] {tool}: not found in PATH")
+            elif versions.get(tool):
+                self.logger.info(f"  [OK] {tool}: {versions[tool]} ({tool_path})")
+            else:
+                self.logger.info(f"  [OK] {tool}: found at {tool_path}")
                 
         # Display build directories
         self.logger.info("Build directories:")
@@ -383,6 +974,24 @@ class BuildOrchestrator:
                 
         return 0
         
+    def _probe_tool_version(self, tool: str, tool_path: Path) -> Optional[str]:
+        """Return the first line of a tool's version output, or None if unavailable."""
+        try:
+            version_args = ["--version"]
+            if tool == "cl":  # MSVC compiler uses different syntax
+                version_args = []
+                
+            spawn_cmd, spawn_options = self._spawn_args([str(tool_path)] + version_args, None)
+            result = subprocess.run(spawn_cmd, capture_output=True, text=True, timeout=30, **spawn_options)
+            if result.returncode != 0:
+                return None
+            version_line = result.stdout.split('\n')[0].strip()
+            if not version_line and result.stderr:
+                version_line = result.stderr.split('\n')[0].strip()
+            return version_line or None
+        except (subprocess.TimeoutExpired, Exception):
+            return None
+        
     def cmd_configure(self, args):
         """Configure the build system."""
         
@@ -403,7 +1012,6 @@ class BuildOrchestrator:
         # Clean configure if requested
         if args.clean:
             self.logger.info("Cleaning build directory for fresh configuration")
-            import shutil
             if build_dir.exists():
                 shutil.rmtree(build_dir)
             self.ensure_directory(build_dir)
@@ -411,18 +1019,16 @@ class BuildOrchestrator:
         # CMake configuration command
         cmake_cmd = [
             "cmake",
-            "-S", str(self.project_root),
+            "-S", self.project_root_str,
             "-B", str(build_dir),
             "-G", self.platform_info['preferred_generator'],
             f"-DCMAKE_BUILD_TYPE={build_type}"
         ]
         
         # Add platform-specific options
-        if self.platform_info['system'] == 'windows':
+        if self._is_windows:
             # Ensure we use the right runtime library
-            cmake_cmd.extend([
-                "-DCMAKE_MSVC_RUNTIME_LIBRARY=MultiThreadedDebugDLL" if build_type == "Debug" else "-DCMAKE_MSVC_RUNTIME_LIBRARY=MultiThreaded"
-            ])
+            cmake_cmd.append(_CMAKE_WINDOWS_RTLIB[build_type])
             
         result = self.run_command(cmake_cmd, concise=True)
         
@@ -464,21 +1070,18 @@ class BuildOrchestrator:
             cmake_cmd.extend(["--parallel", str(args.parallel)])
         else:
             # Use reasonable default for parallel jobs
-            import multiprocessing
-            jobs = max(1, multiprocessing.cpu_count() - 1)
+            jobs = max(1, _CPU_COUNT - 1)
             cmake_cmd.extend(["--parallel", str(jobs)])
             
-        result = self.run_command(cmake_cmd, concise=True, capture_output=True)
-        
-        # Filter out unwanted output lines
-        if result.stdout:
-            filtered_lines = []
-            for line in result.stdout.split('\n'):
-                line = line.strip()
-                if line and not line.startswith('ninja: no work to do'):
-                    filtered_lines.append(line)
-            if filtered_lines:
-                print('\n'.join(filtered_lines))
+        def build_output_line(line):
+            # Filter out unwanted output lines, printing the rest stripped
+            line = line.strip()
+            if line and not line.startswith('ninja: no work to do'):
+                return line + '\n'
+            return None
+            
+        # Stream the build log as it is produced instead of holding it all until cmake exits
+        result = self._stream_command(cmake_cmd, sys.stdout, collect=False, line_transform=build_output_line)
         
         if result.returncode == 0:
             # Show output location with relative path
@@ -496,124 +1099,43 @@ class BuildOrchestrator:
             self.logger.info("3. Check build logs in artifacts/debug/logs/")
             return 1
             
-    def cmd_install_git_hooks(self, args):
-        """Install git pre-commit hooks for automatic formatting checks."""
-
-        
-        # Check if we're in a git repository
-        git_dir = self.project_root / ".git"
-        if not git_dir.exists():
-            self.logger.error("Not a git repository - .git directory not found")
-            return 1
-            
-        hooks_dir = git_dir / "hooks"
-        hooks_dir.mkdir(exist_ok=True)
-        
-        # Create pre-commit hook
-        pre_commit_hook = hooks_dir / "pre-commit"
-        
-        hook_content = f'''#!/bin/bash
-# Pre-commit hook for Dosatsu formatting checks
-# Generated by build system
-
-echo "Running pre-commit formatting checks..."
-
-# Change to project root
-cd "{self.project_root}"
-
-# Get staged C++ files
-STAGED_FILES=$(git diff --cached --name-only --diff-filter=ACM | grep -E "\\.(cpp|h|hpp|cxx|cc)$")
-
-if [ -z "$STAGED_FILES" ]; then
-    echo "No C++ files staged for commit"
-    exit 0
-fi
-
-echo "Checking formatting for staged files..."
-
-# Run format check on staged files
-please format --check-only --files $STAGED_FILES
-
-# Check the exit code
-if [ $? -ne 0 ]; then
-    echo ""
-    echo "[ERROR] Pre-commit formatting check failed!"
-    echo "Fix formatting issues before committing:"
-    echo "  please format"
-    echo ""
-    echo "Or skip this check with: git commit --no-verify"
-    exit 1
-fi
-
-echo "[OK] Pre-commit formatting check passed!"
-exit 0
-'''
-        
-        try:
-            with open(pre_commit_hook, 'w') as f:
-                f.write(hook_content)
-                
-            # Make the hook executable (on Unix-like systems)
-            if self.platform_info['system'] != 'windows':
-                import stat
-                pre_commit_hook.chmod(stat.S_IRWXU | stat.S_IRGRP | stat.S_IROTH)
-                
-            self.logger.info(f"[OK] Pre-commit hook installed: {pre_commit_hook}")
-            self.logger.info("Formatting checks will now run automatically before each commit")
-            self.logger.info("Use 'git commit --no-verify' to skip the formatting check if needed")
-            return 0
-            
-        except Exception as e:
-            self.logger.error(f"Failed to install pre-commit hook: {e}")
-            return 1
-            
-        self.logger.info("Running CMake build...")
-        result = self.run_command(cmake_cmd)
-        
-        if result.returncode == 0:
-            self.logger.info("Build completed successfully!")
-            
-            # Show output location
-            output_dir = self.get_output_directory(build_type.lower(), "bin")
-            self.logger.info(f"Executables available in: {output_dir}")
-            return 0
-        else:
-            self.logger.error("Build failed!")
-            
-            # Provide helpful suggestions
-            self.logger.info("Troubleshooting suggestions:")
-            self.logger.info("1. Check if dependencies are properly downloaded (LLVM build may take 30+ minutes)")
-            self.logger.info("2. Try running 'please configure --clean' to reconfigure")
-            self.logger.info("3. Check build logs in artifacts/debug/logs/")
-            return 1
-        
     def cmd_clean(self, args):
         """Clean build artifacts."""
 
         
-        import shutil
-        
-        # Clean debug and release build directories
+        # Collect every existing subtree first; they are disjoint, so removal can run concurrently
+        targets = []
         for build_type in ["debug", "release"]:
             build_dir = self.get_build_directory(build_type)
             if build_dir.exists():
                 self.logger.info(f"Cleaning {build_type} build directory: {build_dir}")
-                try:
-                    shutil.rmtree(build_dir)
-                    self.logger.info(f"[OK] Cleaned {build_type} build directory")
-                except Exception as e:
-                    self.logger.error(f"Failed to clean {build_type} build directory: {e}")
+                targets.append((f"{build_type} build directory", build_dir, False))
                     
             # Also clean output directories
             for output_type in ["bin", "lib"]:
                 output_dir = self.get_output_directory(build_type, output_type)
                 if output_dir.exists():
-                    try:
-                        shutil.rmtree(output_dir)
-                        output_dir.mkdir(parents=True, exist_ok=True)
-                        self.logger.info(f"[OK] Cleaned {build_type} {output_type} directory")
-                    except Exception as e:
-                        self.logger.error(f"Failed to clean {build_type} {output_type} directory: {e}")
+                    targets.append((f"{build_type} {output_type} directory", output_dir, True))
+        
+        def remove_tree(target):
+            _, path, recreate = target
+            try:
+                shutil.rmtree(path)
+                if recreate:
+                    path.mkdir(parents=True, exist_ok=True)
+            except Exception as e:
+                return e
+            return None
+        
+        if targets:
+            # Unlink throughput, not CPU, bounds rmtree, so a few workers help even on small machines
+            with ThreadPoolExecutor(max_workers=min(len(targets), 4)) as executor:
+                errors = list(executor.map(remove_tree, targets))
+            for (label, _, _), error in zip(targets, errors):
+                if error is None:
+                    self.logger.info(f"[OK] Cleaned {label}")
+                else:
+                    self.logger.error(f"Failed to clean {label}: {error}")
                         
         self.logger.info("Clean completed!")
         return 0
@@ -646,13 +1168,10 @@ exit 0
         else:
             # Find all source files in source directory
             source_dirs = [self.project_root / "source"]
-            file_patterns = ["*.h", "*.cpp", "*.hpp", "*.cxx"]
             files_to_format = []
             
             for source_dir in source_dirs:
-                if source_dir.exists():
-                    for pattern in file_patterns:
-                        files_to_format.extend(source_dir.glob(pattern))
+                files_to_format.extend(self._collect_sources(source_dir, (".h", ".cpp", ".hpp", ".cxx")))
                         
         if not files_to_format:
             self.logger.warning("No source files found to format")
@@ -664,6 +1183,20 @@ exit 0
             self.logger.warning("No .clang-format configuration file found")
             self.logger.info("Using clang-format default configuration")
             
+        format_log_dir = self.artifacts_dir / "format"
+        self.ensure_directory(format_log_dir)
+        format_log_file = format_log_dir / "format-check.log"
+        
+        # Skip files that haven't changed since they last passed formatting
+        cache_file = format_log_dir / "cache.json"
+        cache_key = self._cache_key(clang_format_tool, clang_format_config)
+        cache = {} if getattr(args, 'no_cache', False) else self._load_clean_cache(cache_file, cache_key)
+        total_files = len(files_to_format)
+        files_to_format = self._filter_changed_files(files_to_format, cache)
+        if not files_to_format:
+            self.logger.info(f"[OK] All {total_files} files unchanged since last clean format run")
+            return 0
+            
         # Format files
         if args.check_only:
             # Use --dry-run and --Werror to check formatting
@@ -671,16 +1204,10 @@ exit 0
         else:
             cmd = [str(clang_format_tool), "-i"]
             
-        # Add files to command
-        cmd.extend([str(f) for f in files_to_format])
-        
-        # Run clang-format
-        result = self.run_command(cmd, capture_output=args.check_only, concise=True)
+        # Use more chunks than cores so one slow chunk doesn't leave cores idle
+        result = self._run_chunked(cmd, files_to_format, 2 * _CPU_COUNT, _CPU_COUNT, capture_output=args.check_only)
         
         # Save formatting log
-        format_log_dir = self.artifacts_dir / "format"
-        self.ensure_directory(format_log_dir)
-        format_log_file = format_log_dir / "format-check.log"
         
         if args.check_only and result.stdout:
             with open(format_log_file, 'w') as f:
@@ -697,7 +1224,8 @@ exit 0
         if result.returncode == 0:
             if args.check_only:
                 self.logger.info("[OK] All files are properly formatted")
-
+                
+            self._record_clean_files(cache_file, cache_key, cache, files_to_format)
             return 0
         else:
             if args.check_only:
@@ -729,7 +1257,6 @@ exit 0
         
         # Profiling will be used for timing in fast mode, no separate timing needed
         # Add total execution timing to understand overhead vs check time
-        import time
         total_start_time = time.time()
         
         # Find clang-tidy tool
@@ -759,13 +1286,34 @@ exit 0
         else:
             # Find all source files in source directory (only .cpp files for linting)
             source_dirs = [self.project_root / "source"]
-            file_patterns = ["*.cpp"]  # Only lint .cpp files to avoid header duplication
             files_to_lint = []
             
             for source_dir in source_dirs:
-                if source_dir.exists():
-                    for pattern in file_patterns:
-                        files_to_lint.extend(source_dir.glob(pattern))
+                # Only lint .cpp files to avoid header duplication
+                files_to_lint.extend(self._collect_sources(source_dir, (".cpp",)))
+                
+            ccache_log = self.artifacts_dir / "debug" / "ccache.log"
+            if args.incremental and ccache_log.exists():
+                missed = self._ccache_missed_files(ccache_log)
+                if missed is None:
+                    self.logger.warning("Could not read any ccache results from the log; linting all sources")
+                else:
+                    self.logger.info(f"Incremental: {len(missed)} translation units missed ccache in the last build")
+                    files_to_lint = [f for f in files_to_lint
+                                     if os.path.normcase(os.path.normpath(str(f))) in missed]
+                
+            if args.changed_only:
+                changed = self._git_changed_files()
+                if changed is None:
+                    self.logger.warning("Could not list changed files with git; linting all sources")
+                elif os.path.normcase(str(self.project_root / ".clang-tidy")) in changed:
+                    self.logger.info("Changed-only: .clang-tidy changed, linting all sources")
+                else:
+                    files_to_lint = [f for f in files_to_lint
+                                     if os.path.normcase(os.path.normpath(str(f))) in changed]
+                    if not files_to_lint:
+                        self.logger.info("[OK] No changed source files to lint")
+                        return 0
                         
         if not files_to_lint:
             self.logger.warning("No source files found to lint")
@@ -775,7 +1323,10 @@ exit 0
         
         # Check for compile_commands.json
         compile_commands = self.artifacts_dir / "debug" / "build" / "compile_commands.json"
-        if not compile_commands.exists():
+        try:
+            # Stat once; the mtime also keys the in-memory compilation database index
+            compile_commands_mtime_ns = compile_commands.stat().st_mtime_ns
+        except OSError:
             self.logger.error("compile_commands.json not found")
             self.logger.info("Run 'please configure' first to generate compilation database")
             return 1
@@ -792,30 +1343,62 @@ exit 0
         
         # Prepare base clang-tidy command
         build_dir = compile_commands.parent
-        base_cmd = [str(clang_tidy_tool), f"-p={build_dir}", f"--config-file={clang_tidy_config}"]
+        base_cmd = [str(clang_tidy_tool), f"-p={build_dir}", f"--config-file={clang_tidy_config}", "--quiet"]
         
         # Add profiling for lint mode (fast_mode=True)
         profile_dir = None
         if fast_mode:
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             profile_dir = self.artifacts_dir / "lint" / f"profile_{timestamp}"
             self.ensure_directory(profile_dir)
             base_cmd.extend(["--enable-check-profile", f"--store-check-profile={profile_dir}"])
         
         # Add check filtering for fast mode
         if fast_mode:
-            slow_checks = self._read_slow_checks_file()
-            if slow_checks:
-                # Build the -checks argument to disable slow checks
-                disabled_checks = ','.join(f'-{check}' for check in slow_checks)
-                base_cmd.extend([f"-checks={disabled_checks}"])
+            slow_checks_arg = self._slow_checks_argument()
+            if slow_checks_arg:
+                base_cmd.append(slow_checks_arg)
+        
+        # Skip files that haven't changed since they last linted clean. Each file also carries
+        # the state of the headers it includes, since those can change its diagnostics.
+        cache_file = lint_log_dir / ("cache.json" if fast_mode else "full-cache.json")
+        cache_key = self._cache_key(clang_tidy_tool, clang_tidy_config, compile_commands,
+                                    "fast" if fast_mode else "full", *self._read_slow_checks_file())
+        cache = {} if args.no_cache else self._load_clean_cache(cache_file, cache_key)
+        units = self._load_lint_dependencies(build_dir, lint_log_dir / "deps.json")
+        dependency_states = self._dependency_fingerprints(files_to_lint, units)
+        total_files = len(files_to_lint)
+        files_to_lint = self._filter_changed_files(files_to_lint, cache, dependency_states)
+        
+        # A changed file may still preprocess to a translation unit that already linted clean
+        result_dir = lint_log_dir / ("results" if fast_mode else "full-results")
+        preprocessed_keys = {} if args.no_cache or not files_to_lint else \
+            self._preprocessed_keys(files_to_lint, compile_commands, compile_commands_mtime_ns, cache_key)
+        reused = [f for f in files_to_lint
+                  if str(f) in preprocessed_keys and (result_dir / preprocessed_keys[str(f)]).exists()]
+        if reused:
+            self.logger.info(f"Reusing clean results for {len(reused)} files with unchanged preprocessed source")
+            self._record_clean_files(cache_file, cache_key, cache, reused, dependency_states)
+            self._store_clean_results(result_dir, [preprocessed_keys[str(f)] for f in reused])
+            reused_set = set(reused)
+            files_to_lint = [f for f in files_to_lint if f not in reused_set]
+            
+        if not files_to_lint:
+            self.logger.info(f"[OK] All {total_files} files unchanged since last clean lint run")
+            return 0
         
         # Choose processing method: per-file is default, batch only when explicitly requested
         if use_batch_processing:
-            result = self._lint_batch(args, base_cmd, files_to_lint, lint_log_dir, profile_dir)
+            result, phase1_stats = self._lint_batch(args, base_cmd, files_to_lint, lint_log_dir, profile_dir)
         else:
-            result = self._lint_per_file(args, base_cmd, files_to_lint, lint_log_dir, profile_dir)
+            result, phase1_stats = self._lint_per_file(args, base_cmd, files_to_lint, lint_log_dir, profile_dir)
+            
+        if result == 0:
+            files_with_issues = set(self._get_files_with_issues(phase1_stats, files_to_lint))
+            clean_files = [f for f in files_to_lint if f not in files_with_issues]
+            self._record_clean_files(cache_file, cache_key, cache, clean_files, dependency_states)
+            self._store_clean_results(result_dir, [preprocessed_keys[str(f)] for f in clean_files
+                                                   if str(f) in preprocessed_keys])
         
         # Show timing breakdown for analysis
         total_end_time = time.time()
@@ -827,87 +1410,110 @@ exit 0
         
         return result
             
+    def _git_changed_files(self) -> Optional[set]:
+        """Return normalized paths of files added, copied, modified or renamed since HEAD.
+        
+        Staged and unstaged changes both count. Returns None if git can't be queried.
+        """
+        try:
+            result = self.run_command(['git', 'diff', '--name-only', '--relative', '--diff-filter=ACMR', 'HEAD'],
+                                      capture_output=True, silent=True, concise=True)
+        except OSError:
+            return None
+        if result.returncode != 0:
+            return None
+        return {os.path.normcase(os.path.normpath(self.project_root / name)) for name in result.stdout.splitlines() if name}
+        
+    def _ccache_missed_files(self, ccache_log: Path) -> Optional[set]:
+        """Return the normalized source paths whose latest ccache lookup was a miss.
+        
+        A hit means the translation unit compiled identically before, and with .clang-tidy in
+        CCACHE_EXTRAFILES also under the same lint configuration, so only misses need linting.
+        Lines from concurrent compiler processes interleave, so results are matched by PID.
+        Returns None if the log holds no source/result pairs, since then nothing is known.
+        """
+        # ccache logs source paths as given to the compiler, which runs in the build directory
+        build_dir = self.artifacts_dir / "debug" / "build"
+        sources_by_pid = {}
+        missed = {}
+        with open(ccache_log, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                match = _CCACHE_LOG_RE.match(line.rstrip('\n'))
+                if not match:
+                    continue
+                pid, field, value = match.groups()
+                if field == 'Source file':
+                    sources_by_pid[pid] = value
+                elif pid in sources_by_pid:
+                    source = os.path.normcase(os.path.normpath(build_dir / sources_by_pid.pop(pid)))
+                    missed[source] = 'miss' in value
+        if not missed:
+            return None
+        return {source for source, was_miss in missed.items() if was_miss}
+        
     def _filter_clang_tidy_output(self, output: str) -> str:
         """Filter clang-tidy output to remove noise and organize results."""
-        filtered_lines = []
-        for line in output.split('\n'):
-            # Skip suppressed warnings messages and header filter messages
-            if (not line.strip().startswith("Suppressed") and 
-                "Use -header-filter=" not in line and
-                "warnings generated" not in line and
-                line.strip()):
-                filtered_lines.append(line)
-        return '\n'.join(filtered_lines)
+        return '\n'.join(line for line in output.split('\n')
+                         if line.strip() and not _CLANG_TIDY_NOISE_RE.search(line))
     
-    def _analyze_clang_tidy_output(self, output: str) -> dict:
-        """Analyze clang-tidy output and generate comprehensive statistics."""
-        stats = {
-            'total_issues': 0,
-            'error_count': 0,
-            'warning_count': 0,
-            'note_count': 0,
-            'by_severity': {},
-            'by_check': {},
-            'by_file': {},
-            'issues': []
-        }
+    def _analyze_clang_tidy_output(self, lines: Iterable[str], collect_issues: bool = True) -> dict:
+        """Analyze clang-tidy output and generate comprehensive statistics.
         
-        current_file = None
-        for line in output.split('\n'):
-            line = line.strip()
-            if not line:
+        Takes an iterable of lines (a pipe, file or io.StringIO) so output is never split into
+        a second full-size list. stats['filtered_text'] holds the output with the same noise
+        removed as _filter_clang_tidy_output, ready to show to the user. With collect_issues
+        False only the counts are kept and stats['issues'] and stats['filtered_text'] stay empty.
+        """
+        # Tallied in locals; the per-severity and total counts are derived once at the end
+        by_severity = collections.Counter()
+        by_check = collections.Counter()
+        by_file = collections.Counter()
+        issues = []
+        filtered = []
+        applied_fixes = 0
+        fixit_notes = 0
+        for line in lines:
+            if collect_issues and line.strip() and not _CLANG_TIDY_NOISE_RE.search(line):
+                filtered.append(line.rstrip('\n'))
+            match = _DIAG_RE.match(line)
+            if not match:
+                applied = _APPLIED_FIXES_RE.search(line)
+                if applied:
+                    applied_fixes += int(applied.group(1))
                 continue
-                
-            # Match file paths (lines ending with issues like "error:" or "warning:")
-            if ':' in line and ('error:' in line or 'warning:' in line or 'note:' in line):
-                parts = line.split(':')
-                if len(parts) >= 4:
-                    file_path = parts[0]
-                    line_num = parts[1]
-                    col_num = parts[2]
-                    rest = ':'.join(parts[3:]).strip()
-                    
-                    # Determine severity
-                    severity = 'info'
-                    if 'error:' in rest:
-                        severity = 'error'
-                        stats['error_count'] += 1
-                    elif 'warning:' in rest:
-                        severity = 'warning'  
-                        stats['warning_count'] += 1
-                    elif 'note:' in rest:
-                        severity = 'note'
-                        stats['note_count'] += 1
-                        
-                    stats['total_issues'] += 1
-                    
-                    # Update severity counts
-                    stats['by_severity'][severity] = stats['by_severity'].get(severity, 0) + 1
-                    
-                    # Extract check name (usually in brackets)
-                    check_name = 'unknown'
-                    if '[' in rest and ']' in rest:
-                        start = rest.rfind('[')
-                        end = rest.rfind(']')
-                        if start != -1 and end != -1 and end > start:
-                            check_name = rest[start+1:end]
-                            
-                    stats['by_check'][check_name] = stats['by_check'].get(check_name, 0) + 1
-                    
-                    # Update file counts
-                    stats['by_file'][file_path] = stats['by_file'].get(file_path, 0) + 1
-                    
-                    # Store issue details
-                    stats['issues'].append({
-                        'file': file_path,
-                        'line': line_num,
-                        'column': col_num,
-                        'severity': severity,
-                        'check': check_name,
-                        'message': rest,
-                        'raw_line': line
-                    })
-                    
+            file_path, line_num, col_num, rest, severity, check_name = match.groups()
+            if severity == 'fatal error':
+                severity = 'error'
+            elif severity == 'note' and 'FIX-IT applied' in rest:
+                fixit_notes += 1
+            check_name = check_name or 'unknown'
+            
+            by_severity[severity] += 1
+            by_check[check_name] += 1
+            by_file[file_path] += 1
+            
+            # Store issue details
+            if collect_issues:
+                issues.append({
+                    'file': file_path,
+                    'line': line_num,
+                    'column': col_num,
+                    'severity': severity,
+                    'check': check_name,
+                    'message': rest
+                })
+            
+        stats = {'total_issues': sum(by_severity.values())}
+        for severity, count_key in _SEVERITY_COUNT_KEYS.items():
+            stats[count_key] = by_severity[severity]
+        stats.update({
+            'applied_fixes': max(applied_fixes, fixit_notes),
+            'by_severity': by_severity,
+            'by_check': by_check,
+            'by_file': by_file,
+            'issues': issues,
+            'filtered_text': '\n'.join(filtered)
+        })
         return stats
     
     def _generate_lint_report(self, stats: dict, output_file: Path, format_type: str = 'markdown') -> None:
@@ -920,106 +1526,92 @@ exit 0
     
     def _write_markdown_report(self, f, stats: dict) -> None:
         """Write markdown-formatted report."""
-        f.write("# Clang-Tidy Analysis Report\n\n")
+        # Built up in memory and written once; reports can hold tens of thousands of issues
+        parts = ["# Clang-Tidy Analysis Report\n\n"]
         
         # Summary
-        f.write("## Summary\n")
-        f.write(f"- **Total Issues**: {stats['total_issues']}\n")
-        f.write(f"- **Errors**: {stats['error_count']}\n")
-        f.write(f"- **Warnings**: {stats['warning_count']}\n")
-        f.write(f"- **Notes**: {stats['note_count']}\n\n")
+        parts.append("## Summary\n"
+                     f"- **Total Issues**: {stats['total_issues']}\n"
+                     f"- **Errors**: {stats['error_count']}\n"
+                     f"- **Warnings**: {stats['warning_count']}\n"
+                     f"- **Notes**: {stats['note_count']}\n\n")
         
         # Issues by severity
         if stats['by_severity']:
-            f.write("## Issues by Severity\n")
-            for severity, count in sorted(stats['by_severity'].items()):
-                f.write(f"- **{severity.title()}**: {count}\n")
-            f.write("\n")
+            parts.append("## Issues by Severity\n")
+            parts.extend(f"- **{severity.title()}**: {count}\n" for severity, count in sorted(stats['by_severity'].items()))
+            parts.append("\n")
         
         # Top check types
         if stats['by_check']:
-            f.write("## Most Common Check Types\n")
-            sorted_checks = sorted(stats['by_check'].items(), key=lambda x: x[1], reverse=True)
-            for check, count in sorted_checks[:10]:  # Top 10
-                f.write(f"- **{check}**: {count} issues\n")
-            f.write("\n")
+            parts.append("## Most Common Check Types\n")
+            parts.extend(f"- **{check}**: {count} issues\n" for check, count in stats['by_check'].most_common(10))
+            parts.append("\n")
         
         # Files with most issues
         if stats['by_file']:
-            f.write("## Files with Most Issues\n")
-            sorted_files = sorted(stats['by_file'].items(), key=lambda x: x[1], reverse=True)
-            for file_path, count in sorted_files[:10]:  # Top 10
-                f.write(f"- **{file_path}**: {count} issues\n")
-            f.write("\n")
+            parts.append("## Files with Most Issues\n")
+            parts.extend(f"- **{file_path}**: {count} issues\n" for file_path, count in stats['by_file'].most_common(10))
+            parts.append("\n")
         
         # Detailed issues
         if stats['issues']:
-            f.write("## Detailed Issues\n\n")
+            parts.append("## Detailed Issues\n\n")
             current_file = None
             for issue in stats['issues']:
                 if issue['file'] != current_file:
                     current_file = issue['file']
-                    f.write(f"### {current_file}\n\n")
+                    parts.append(f"### {current_file}\n\n")
                 
-                severity_icon = {'error': '[ERROR]', 'warning': '[WARN]', 'note': '[NOTE]'}.get(issue['severity'], '[INFO]')
-                f.write(f"{severity_icon} **Line {issue['line']}**: {issue['message']}\n")
-                f.write(f"   - Check: `{issue['check']}`\n")
-                f.write(f"   - Severity: {issue['severity']}\n\n")
+                severity_icon = _SEVERITY_TAGS.get(issue['severity'], '[INFO]')
+                parts.append(f"{severity_icon} **Line {issue['line']}**: {issue['message']}\n"
+                             f"   - Check: `{issue['check']}`\n"
+                             f"   - Severity: {issue['severity']}\n\n")
+        f.write(''.join(parts))
     
     def _write_text_report(self, f, stats: dict) -> None:
         """Write plain text-formatted report."""
-        f.write("CLANG-TIDY ANALYSIS REPORT\n")
-        f.write("=" * 50 + "\n\n")
+        parts = ["CLANG-TIDY ANALYSIS REPORT\n", "=" * 50 + "\n\n"]
         
         # Summary
-        f.write("SUMMARY\n")
-        f.write("-" * 20 + "\n")
-        f.write(f"Total Issues: {stats['total_issues']}\n")
-        f.write(f"Errors: {stats['error_count']}\n")
-        f.write(f"Warnings: {stats['warning_count']}\n")
-        f.write(f"Notes: {stats['note_count']}\n\n")
+        parts.append("SUMMARY\n" + "-" * 20 + "\n"
+                     f"Total Issues: {stats['total_issues']}\n"
+                     f"Errors: {stats['error_count']}\n"
+                     f"Warnings: {stats['warning_count']}\n"
+                     f"Notes: {stats['note_count']}\n\n")
         
         # Issues by severity
         if stats['by_severity']:
-            f.write("ISSUES BY SEVERITY\n")
-            f.write("-" * 20 + "\n")
-            for severity, count in sorted(stats['by_severity'].items()):
-                f.write(f"{severity.title()}: {count}\n")
-            f.write("\n")
+            parts.append("ISSUES BY SEVERITY\n" + "-" * 20 + "\n")
+            parts.extend(f"{severity.title()}: {count}\n" for severity, count in sorted(stats['by_severity'].items()))
+            parts.append("\n")
         
         # Top check types
         if stats['by_check']:
-            f.write("MOST COMMON CHECK TYPES\n")
-            f.write("-" * 30 + "\n")
-            sorted_checks = sorted(stats['by_check'].items(), key=lambda x: x[1], reverse=True)
-            for check, count in sorted_checks[:10]:  # Top 10
-                f.write(f"{check}: {count} issues\n")
-            f.write("\n")
+            parts.append("MOST COMMON CHECK TYPES\n" + "-" * 30 + "\n")
+            parts.extend(f"{check}: {count} issues\n" for check, count in stats['by_check'].most_common(10))
+            parts.append("\n")
         
         # Files with most issues
         if stats['by_file']:
-            f.write("FILES WITH MOST ISSUES\n")
-            f.write("-" * 25 + "\n")
-            sorted_files = sorted(stats['by_file'].items(), key=lambda x: x[1], reverse=True)
-            for file_path, count in sorted_files[:10]:  # Top 10
-                f.write(f"{file_path}: {count} issues\n")
-            f.write("\n")
+            parts.append("FILES WITH MOST ISSUES\n" + "-" * 25 + "\n")
+            parts.extend(f"{file_path}: {count} issues\n" for file_path, count in stats['by_file'].most_common(10))
+            parts.append("\n")
         
         # Detailed issues
         if stats['issues']:
-            f.write("DETAILED ISSUES\n")
-            f.write("-" * 20 + "\n\n")
+            parts.append("DETAILED ISSUES\n" + "-" * 20 + "\n\n")
             current_file = None
             for issue in stats['issues']:
                 if issue['file'] != current_file:
                     current_file = issue['file']
-                    f.write(f"FILE: {current_file}\n")
-                    f.write("~" * len(current_file) + "\n")
+                    parts.append(f"FILE: {current_file}\n" + "~" * len(current_file) + "\n")
                 
-                severity_prefix = {'error': '[ERROR]', 'warning': '[WARN]', 'note': '[NOTE]'}.get(issue['severity'], '[INFO]')
-                f.write(f"{severity_prefix} Line {issue['line']}: {issue['message']}\n")
-                f.write(f"         Check: {issue['check']}\n")
-                f.write(f"         Severity: {issue['severity']}\n\n")
+                severity_prefix = _SEVERITY_TAGS.get(issue['severity'], '[INFO]')
+                parts.append(f"{severity_prefix} Line {issue['line']}: {issue['message']}\n"
+                             f"         Check: {issue['check']}\n"
+                             f"         Severity: {issue['severity']}\n\n")
+        f.write(''.join(parts))
                     
     def _print_lint_summary(self, stats: dict) -> None:
         """Print a concise lint summary to console."""
@@ -1038,31 +1630,32 @@ exit 0
             
         # Show top 3 most common check types
         if stats['by_check']:
-            sorted_checks = sorted(stats['by_check'].items(), key=lambda x: x[1], reverse=True)
             self.logger.info("Most common issues:")
-            for check, count in sorted_checks[:3]:
+            for check, count in stats['by_check'].most_common(3):
                 self.logger.info(f"  - {check}: {count}")
                 
         # Show files with most issues
         if stats['by_file']:
-            sorted_files = sorted(stats['by_file'].items(), key=lambda x: x[1], reverse=True)
-            if len(sorted_files) > 1:
+            if len(stats['by_file']) > 1:
                 self.logger.info("Files needing attention:")
-                for file_path, count in sorted_files[:3]:
+                for file_path, count in stats['by_file'].most_common(3):
                     rel_path = Path(file_path).name  # Just filename for brevity
                     self.logger.info(f"  - {rel_path}: {count} issues")
     
     def _lint_batch(self, args, base_cmd, files_to_lint, lint_log_dir, profile_dir):
-        """Execute lint in traditional batch mode with performance optimizations."""
-        file_args = [str(f) for f in files_to_lint]
+        """Execute lint in traditional batch mode. Returns (exit code, Phase 1 stats)."""
+        jobs = args.jobs or _default_lint_jobs()
         
         # ===== PHASE 1: Auto-fix phase =====
-        phase1_cmd = base_cmd + ["--fix", "--fix-errors"] + file_args
-        phase1_result = self.run_command(phase1_cmd, capture_output=True, concise=True)
+        # clang-tidy is single-threaded, so shard the file list across cores. Output is streamed
+        # to the log as it arrives so progress can be followed on long runs.
+        phase1_output_file = lint_log_dir / "clang-tidy-phase1-autofix.txt"
+        phase1_result = self._run_chunked(base_cmd + ["--fix", "--fix-errors"], files_to_lint, jobs, jobs,
+                                          stream_to=phase1_output_file)
         
         # Analyze Phase 1 output for summary
         phase1_output_to_analyze = phase1_result.stdout if phase1_result.stdout else ""
-        phase1_stats = self._analyze_clang_tidy_output(phase1_output_to_analyze)
+        phase1_stats = self._analyze_clang_tidy_output(io.StringIO(phase1_output_to_analyze), collect_issues=not args.summary_only)
         
         if phase1_stats['total_issues'] > 0:
             self.logger.info(f"Phase 1: Applied automatic fixes to {phase1_stats['total_issues']} issues")
@@ -1106,11 +1699,11 @@ exit 0
                 # Only process files that had issues in Phase 1
                 phase2_file_args = [str(f) for f in files_with_issues]
                 phase2_cmd = base_cmd + phase2_file_args
-                phase2_result = self.run_command(phase2_cmd, capture_output=True, concise=True)
+                phase2_result = self._run_chunked(base_cmd, files_with_issues, jobs, jobs, capture_output=True)
                 
                 # Analyze Phase 2 output and generate statistics
                 phase2_output_to_analyze = phase2_result.stdout if phase2_result.stdout else ""
-                phase2_stats = self._analyze_clang_tidy_output(phase2_output_to_analyze)
+                phase2_stats = self._analyze_clang_tidy_output(io.StringIO(phase2_output_to_analyze), collect_issues=not args.summary_only)
                 
                 # Only save Phase 2 output if there are issues requiring manual fixes
                 if phase2_stats['total_issues'] > 0:
@@ -1128,77 +1721,128 @@ exit 0
                             f.write("\nstderr:\n")
                             f.write(phase2_result.stderr)
         
-        return self._finalize_lint_results(args, phase1_stats, phase2_stats, None, raw_output_file, lint_log_dir, skip_phase2, profile_dir, None)
+        return self._finalize_lint_results(args, phase1_stats, phase2_stats, None, raw_output_file, lint_log_dir, skip_phase2, profile_dir, None), phase1_stats
     
     def _lint_per_file(self, args, base_cmd, files_to_lint, lint_log_dir, profile_dir):
-        """Execute lint with per-file processing and progress reporting."""
+        """Execute lint with per-file processing. Returns (exit code, Phase 1 stats)."""
         total_files = len(files_to_lint)
 
         
         # Track timing for this method
-        import time
         method_start_time = time.time()
         
         # Aggregate statistics
-        aggregate_phase1_stats = {'total_issues': 0, 'error_count': 0, 'warning_count': 0, 'note_count': 0, 'by_severity': {}, 'by_check': {}, 'by_file': {}, 'issues': []}
-        aggregate_phase2_stats = {'total_issues': 0, 'error_count': 0, 'warning_count': 0, 'note_count': 0, 'by_severity': {}, 'by_check': {}, 'by_file': {}, 'issues': []}
+        aggregate_phase1_stats = {'total_issues': 0, 'error_count': 0, 'warning_count': 0, 'note_count': 0, 'applied_fixes': 0, 'by_severity': collections.Counter(), 'by_check': collections.Counter(), 'by_file': collections.Counter(), 'issues': []}
+        aggregate_phase2_stats = {'total_issues': 0, 'error_count': 0, 'warning_count': 0, 'note_count': 0, 'applied_fixes': 0, 'by_severity': collections.Counter(), 'by_check': collections.Counter(), 'by_file': collections.Counter(), 'issues': []}
         
         # Output files for aggregated results
         phase1_output_file = lint_log_dir / "clang-tidy-phase1-autofix.txt"
         raw_output_file = lint_log_dir / "clang-tidy-raw.txt"
         
-        all_phase1_output = []
-        all_phase2_output = []
         files_with_issues = []
         
-        for i, file_path in enumerate(files_to_lint, 1):
-            rel_path = file_path.relative_to(self.project_root) if file_path.is_relative_to(self.project_root) else file_path
+        def lint_chunk(chunk):
+            """Run Phase 1 and, if it found anything, Phase 2 for a group of files.
             
-            file_arg = [str(file_path)]
+            Returns the Phase 1 stats and the Phase 2 report as (label, text) pairs, or None
+            if Phase 2 was skipped.
+            """
+            file_args = [str(f) for f in chunk]
+            header = ', '.join(file_args)
             
-            # ===== PHASE 1 for this file =====
-            phase1_cmd = base_cmd + ["--fix", "--fix-errors"] + file_arg
-            phase1_result = self.run_command(phase1_cmd, capture_output=True, concise=True)
+            def report(files):
+                result = self.run_command(base_cmd + [str(f) for f in files], capture_output=True, concise=True)
+                return self._split_clang_tidy_output(result.stdout or "")
             
-            # Analyze Phase 1 output
+            # ===== PHASE 1 for these files =====
+            phase1_cmd = base_cmd + ["--fix", "--fix-errors"] + file_args
+            phase1_result = self._stream_command(phase1_cmd, None)
             phase1_output = phase1_result.stdout if phase1_result.stdout else ""
-            phase1_stats = self._analyze_clang_tidy_output(phase1_output)
-            
+            phase1_stats = self._analyze_clang_tidy_output(io.StringIO(phase1_output), collect_issues=not args.summary_only)
+            with log_lock:
+                phase1_log.write(f"=== {header} ===\n{phase1_output}")
+                phase1_log.flush()
+                
+            # ===== PHASE 2 for these files (conditional) =====
+            if args.fast or (phase1_stats['total_issues'] == 0 and phase1_result.returncode == 0):
+                return phase1_stats, None
+            if phase1_result.returncode != 0:
+                # A failed run can't be attributed to particular files, so report the whole group
+                return phase1_stats, self._label_lint_sections(chunk, report(chunk))
+            phase1_sections = self._split_clang_tidy_output(phase1_output)
+            if phase1_stats['applied_fixes'] == 0:
+                # Nothing was rewritten, so a report-only run would print exactly what Phase 1 did
+                return phase1_stats, self._label_lint_sections(chunk, phase1_sections)
+                
+            # Rerun only the files Phase 1 found issues in. Header diagnostics are printed once per
+            # process without saying which file included the header, so an unfixed header's
+            # Phase 1 diagnostics are kept as they are; a header that was fixed can only be
+            # re-checked by rerunning the whole group.
+            match_file = self._lint_file_matcher(chunk)
+            files_with_issues = set()
+            header_sections = {}
+            for file_path, text in phase1_sections.items():
+                lint_file = match_file(file_path) if file_path else None
+                if lint_file is not None:
+                    files_with_issues.add(lint_file)
+                elif file_path:
+                    header_sections[file_path] = text
+            if any('FIX-IT applied' in text for text in header_sections.values()):
+                phase2_files = chunk
+                header_sections = {}
+            else:
+                phase2_files = [f for f in chunk if f in files_with_issues]
+            phase2_sections = report(phase2_files) if phase2_files else {}
+            for file_path, text in header_sections.items():
+                # A rerun that saw the header reports it afresh
+                phase2_sections.setdefault(file_path, text)
+            return phase1_stats, self._label_lint_sections(chunk, phase2_sections)
+            
+        # Each clang-tidy process is independent, so run them concurrently. --fix only rewrites
+        # the files being linted (the header filter excludes source/), so jobs can't clash.
+        # Every process re-reads .clang-tidy and compile_commands.json, so with many more files
+        # than workers each one takes several, split into jobs + 3 groups like xargs -P would.
+        # Results are aggregated in the original file order.
+        jobs = max(1, min(total_files, args.jobs or _default_lint_jobs()))
+        job_size = max(1, total_files // (jobs + 3))
+        chunks = [files_to_lint[i:i + job_size] for i in range(0, total_files, job_size)]
+        log_lock = threading.Lock()
+        with open(phase1_output_file, 'w', encoding='utf-8') as phase1_log, \
+                ThreadPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(lint_chunk, chunks))
+            
+        filtered_sections = []
+        for chunk, (phase1_stats, phase2_sections) in zip(chunks, results):
             if phase1_stats['total_issues'] > 0:
-                files_with_issues.append(str(rel_path))
-            
+                files_with_issues.extend(self.make_relative_path(f) for f in self._get_files_with_issues(phase1_stats, chunk))
+                
             # Aggregate Phase 1 statistics
             self._merge_stats(aggregate_phase1_stats, phase1_stats)
-            all_phase1_output.append(f"=== {file_path} ===\n{phase1_output}\n")
-            
-            # ===== PHASE 2 for this file (conditional) =====
-            skip_phase2_for_file = args.fast or (phase1_stats['total_issues'] == 0 and phase1_result.returncode == 0)
             
-            if skip_phase2_for_file:
-                reason = "Fast mode" if args.fast else "No issues in Phase 1"
-                all_phase2_output.append(f"=== {file_path} ===\nSKIPPED: {reason}\n")
-            else:
-                phase2_cmd = base_cmd + file_arg
-                phase2_result = self.run_command(phase2_cmd, capture_output=True, concise=True)
-                
-                # Analyze Phase 2 output
-                phase2_output = phase2_result.stdout if phase2_result.stdout else ""
-                phase2_stats = self._analyze_clang_tidy_output(phase2_output)
-                
-                # Phase 2 processing completed silently
-                
-                # Aggregate Phase 2 statistics
+            # Analyze and aggregate Phase 2 output file by file
+            for label, phase2_output in phase2_sections or ():
+                phase2_stats = self._analyze_clang_tidy_output(io.StringIO(phase2_output), collect_issues=not args.summary_only)
                 self._merge_stats(aggregate_phase2_stats, phase2_stats)
-                all_phase2_output.append(f"=== {file_path} ===\n{phase2_output}\n")
+                if phase2_stats['filtered_text']:
+                    filtered_sections.append(f"=== {label} ===\n{phase2_stats['filtered_text']}")
+        aggregate_phase2_stats['filtered_text'] = '\n'.join(filtered_sections)
         
-        # Only write raw output file if there are manual issues to fix
+        # Only write raw output file if there are manual issues to fix. Sections are written
+        # straight from the results rather than gathered into a second copy of every output.
         if aggregate_phase2_stats['total_issues'] > 0:
+            skipped_reason = "Fast mode" if args.fast else "No issues in Phase 1"
             with open(raw_output_file, 'w', encoding='utf-8') as f:
-                f.write(f"Clang-tidy Phase 2 (Report) results - Per-file processing:\n")
-                f.write(f"Total files processed: {total_files}\n")
-                f.write(f"Total remaining issues: {aggregate_phase2_stats['total_issues']}\n\n")
-                f.write("=== PER-FILE RESULTS ===\n")
-                f.write('\n'.join(all_phase2_output))
+                f.write(f"Clang-tidy Phase 2 (Report) results - Per-file processing:\n"
+                        f"Total files processed: {total_files}\n"
+                        f"Total remaining issues: {aggregate_phase2_stats['total_issues']}\n\n"
+                        "=== PER-FILE RESULTS ===\n")
+                separator = ""
+                for chunk, (_, phase2_sections) in zip(chunks, results):
+                    if phase2_sections is None:
+                        phase2_sections = [(str(file_path), f"SKIPPED: {skipped_reason}") for file_path in chunk]
+                    for label, phase2_output in phase2_sections:
+                        f.write(f"{separator}=== {label} ===\n{phase2_output}\n")
+                        separator = "\n"
         
         # Determine if Phase 2 was skipped for all files
         skip_phase2 = args.fast or aggregate_phase1_stats['total_issues'] == 0
@@ -1207,33 +1851,69 @@ exit 0
         method_end_time = time.time()
         method_execution_time = method_end_time - method_start_time
         
-        return self._finalize_lint_results(args, aggregate_phase1_stats, aggregate_phase2_stats, None, raw_output_file, lint_log_dir, skip_phase2, profile_dir, method_execution_time)
+        return self._finalize_lint_results(args, aggregate_phase1_stats, aggregate_phase2_stats, None, raw_output_file, lint_log_dir, skip_phase2, profile_dir, method_execution_time), aggregate_phase1_stats
     
     def _get_files_with_issues(self, stats, files_to_lint):
         """Get list of files that had issues based on analysis statistics."""
         if not stats or stats['total_issues'] == 0:
             return []
         
-        # Get files that had issues from the by_file statistics
-        files_with_issues = set(stats['by_file'].keys())
-        
-        # Convert to Path objects and filter to only include files we were actually linting
-        files_to_lint_str = {str(f) for f in files_to_lint}
+        match_file = self._lint_file_matcher(files_to_lint)
         result_files = []
+        for file_path in stats['by_file']:
+            match = match_file(file_path)
+            if match is not None:
+                result_files.append(match)
         
-        for file_path in files_with_issues:
-            # clang-tidy might report absolute paths, so we need to match them properly
+        return result_files
+    
+    def _lint_file_matcher(self, files_to_lint) -> Callable[[str], Optional[Path]]:
+        """Return a function mapping a path clang-tidy reports to the file it was given, or None."""
+        # clang-tidy might report paths differently from how they were passed, so fall back to
+        # matching by file name (the first file with that name wins)
+        files_to_lint_str = {str(f) for f in files_to_lint}
+        by_name = {}
+        for lint_file in files_to_lint:
+            by_name.setdefault(lint_file.name, lint_file)
+            
+        def match_file(file_path: str) -> Optional[Path]:
             file_path_obj = Path(file_path)
             if str(file_path_obj) in files_to_lint_str:
-                result_files.append(file_path_obj)
-            else:
-                # Try to match by relative path
-                for lint_file in files_to_lint:
-                    if file_path_obj.name == lint_file.name and file_path_obj.suffix == lint_file.suffix:
-                        result_files.append(lint_file)
-                        break
+                return file_path_obj
+            return by_name.get(file_path_obj.name)
+        return match_file
+    
+    def _split_clang_tidy_output(self, output: str) -> Dict[str, str]:
+        """Split clang-tidy output by the file each warning or error is in.
         
-        return result_files
+        Notes and source excerpts stay with the diagnostic before them, and anything before the
+        first diagnostic is keyed by ''. Sections keep the order their files first appear in.
+        """
+        sections = collections.defaultdict(list)
+        current = sections['']
+        for line in io.StringIO(output):
+            match = _DIAG_RE.match(line)
+            if match and match.group(5) != 'note':
+                current = sections[match.group(1)]
+            current.append(line)
+        return {file_path: ''.join(lines) for file_path, lines in sections.items() if lines}
+    
+    def _label_lint_sections(self, chunk, sections: Dict[str, str]) -> List[tuple]:
+        """Turn split clang-tidy output into (label, text) pairs, one per linted file in order.
+        
+        Diagnostics in headers keep their own path as a label; output that names no file is
+        labelled with the whole group.
+        """
+        match_file = self._lint_file_matcher(chunk)
+        by_file = {str(f): [] for f in chunk}
+        other = {}
+        for file_path, text in sections.items():
+            lint_file = match_file(file_path) if file_path else None
+            if lint_file is not None:
+                by_file[str(lint_file)].append(text)
+            else:
+                other.setdefault(file_path or ', '.join(by_file), []).append(text)
+        return [(label, ''.join(texts)) for label, texts in itertools.chain(by_file.items(), other.items())]
     
     def _merge_stats(self, aggregate_stats, file_stats):
         """Merge file-level statistics into aggregate statistics."""
@@ -1241,16 +1921,12 @@ exit 0
         aggregate_stats['error_count'] += file_stats['error_count']
         aggregate_stats['warning_count'] += file_stats['warning_count']
         aggregate_stats['note_count'] += file_stats['note_count']
+        aggregate_stats['applied_fixes'] += file_stats['applied_fixes']
         
-        # Merge dictionaries
-        for key, value in file_stats['by_severity'].items():
-            aggregate_stats['by_severity'][key] = aggregate_stats['by_severity'].get(key, 0) + value
-        
-        for key, value in file_stats['by_check'].items():
-            aggregate_stats['by_check'][key] = aggregate_stats['by_check'].get(key, 0) + value
-        
-        for key, value in file_stats['by_file'].items():
-            aggregate_stats['by_file'][key] = aggregate_stats['by_file'].get(key, 0) + value
+        # Merge counters
+        aggregate_stats['by_severity'].update(file_stats['by_severity'])
+        aggregate_stats['by_check'].update(file_stats['by_check'])
+        aggregate_stats['by_file'].update(file_stats['by_file'])
         
         # Extend issues list
         aggregate_stats['issues'].extend(file_stats['issues'])
@@ -1281,36 +1957,10 @@ exit 0
         
         # Show filtered output if there are remaining issues (unless summary-only mode)
         if not skip_phase2 and phase2_stats['total_issues'] > 0 and not args.summary_only:
-            # Read the raw output file and filter it
-            with open(raw_output_file, 'r', encoding='utf-8') as f:
-                raw_content = f.read()
-            
-            # Extract just the clang-tidy output from the file
-            if "=== PER-FILE RESULTS ===" in raw_content:
-                # For per-file processing, extract output from each file section
-                sections = raw_content.split("=== PER-FILE RESULTS ===")[1].split("=== ")
-                filtered_sections = []
-                for section in sections[1:]:  # Skip first empty section
-                    if "SKIPPED:" not in section:
-                        file_output = section.split("\n", 1)[1] if "\n" in section else ""
-                        filtered_output = self._filter_clang_tidy_output(file_output)
-                        if filtered_output.strip():
-                            file_path = section.split("\n")[0].replace(" ===", "")
-                            filtered_sections.append(f"=== {file_path} ===\n{filtered_output}")
-                
-                if filtered_sections:
-                    self.logger.info("\nRemaining issues that require manual attention:")
-                    print('\n'.join(filtered_sections))
-            else:
-                # For batch processing, filter the stdout section
-                if "stdout:\n" in raw_content:
-                    stdout_section = raw_content.split("stdout:\n")[1]
-                    if "\nstderr:\n" in stdout_section:
-                        stdout_section = stdout_section.split("\nstderr:\n")[0]
-                    filtered_output = self._filter_clang_tidy_output(stdout_section)
-                    if filtered_output.strip():
-                        self.logger.info("\nRemaining issues that require manual attention:")
-                        print(filtered_output)
+            # Already filtered while the output was analyzed, so the raw file isn't re-read
+            if phase2_stats['filtered_text']:
+                self.logger.info("\nRemaining issues that require manual attention:")
+                print(phase2_stats['filtered_text'])
         
         # Analyze clang-tidy profiling data (only for lint mode, show performance suggestions)
         if profile_dir:
@@ -1337,8 +1987,6 @@ exit 0
     
     def _analyze_clang_tidy_profiling(self, profile_dir, lint_log_dir, show_performance_suggestions=True, total_execution_time=None):
         """Analyze clang-tidy profiling data and generate a summary of the most expensive checks."""
-        import json
-        import glob
         
         try:
             # Find all profile JSON files in the profile directory
@@ -1349,64 +1997,63 @@ exit 0
                 return
             
             # Aggregate timing data from all profile files
-            check_timings = {}
-            total_time = 0.0
+            check_timings = collections.defaultdict(float)
             
-            for profile_file in profile_files:
+            def read_timings(profile_file):
                 try:
-                    with open(profile_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        # Fix Windows path escaping in JSON - double backslashes in paths
-                        import re
-                        # Replace single backslashes in file paths with double backslashes
-                        content = re.sub(r'"file": "([^"]*)"', lambda m: f'"file": "{m.group(1).replace(chr(92), chr(92)+chr(92))}"', content)
-                        profile_data = json.loads(content)
-                    
-                    # Extract timing data from the profile structure
-                    if 'profile' in profile_data:
-                        for key, value in profile_data['profile'].items():
-                            # Parse timing keys like "time.clang-tidy.bugprone-sizeof-expression.wall"
-                            if key.startswith('time.clang-tidy.') and key.endswith('.wall'):
-                                # Extract check name from the key
-                                check_name = key[len('time.clang-tidy.'):-len('.wall')]
-                                check_time = float(value)
-                                check_timings[check_name] = check_timings.get(check_name, 0.0) + check_time
-                                total_time += check_time
-                                
+                    return _read_profile_timings(profile_file)
                 except (json.JSONDecodeError, KeyError, ValueError) as e:
                     self.logger.warning(f"Failed to parse profile file {profile_file}: {e}")
-                    continue
+                    return {}
+                    
+            # Files are independent, so read them concurrently when there are enough to be worth
+            # it. Threads rather than processes: the reads release the GIL, and a process pool
+            # would take longer to start than these small files take to parse.
+            if len(profile_files) >= 4:
+                with ThreadPoolExecutor(max_workers=min(_CPU_COUNT, len(profile_files))) as executor:
+                    file_timings = list(executor.map(read_timings, profile_files))
+            else:
+                file_timings = [read_timings(profile_file) for profile_file in profile_files]
+            for timings in file_timings:
+                for check_name, check_time in timings.items():
+                    check_timings[check_name] += check_time
             
             if not check_timings:
                 self.logger.info("No timing data found in profile files.")
                 return
+            total_time = sum(check_timings.values())
             
             # Sort checks by total time (descending)
-            sorted_checks = sorted(check_timings.items(), key=lambda x: x[1], reverse=True)
+            sorted_checks = sorted(check_timings.items(), key=operator.itemgetter(1), reverse=True)
             top_10_checks = sorted_checks[:10]
             
             # Generate summary
             summary_file = lint_log_dir / "clang-tidy-profile-summary.txt"
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                f.write("Clang-Tidy Performance Profile Summary\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(f"Total profile files analyzed: {len(profile_files)}\n")
-                f.write(f"Total time spent in checks: {total_time:.3f} seconds\n\n")
-                f.write("Top 10 Most Expensive Checks:\n")
-                f.write("-" * 50 + "\n")
-                
-                for i, (check_name, check_time) in enumerate(top_10_checks, 1):
-                    percentage = (check_time / total_time * 100) if total_time > 0 else 0
-                    f.write(f"{i:2d}. {check_name:<40} {check_time:8.3f}s ({percentage:5.1f}%)\n")
-                
-                f.write(f"\nRemaining {len(sorted_checks) - 10} checks: {sum(time for _, time in sorted_checks[10:]):.3f}s\n")
-                
-                # Add all checks for reference
-                f.write(f"\nAll {len(sorted_checks)} checks (sorted by time):\n")
-                f.write("-" * 70 + "\n")
-                for i, (check_name, check_time) in enumerate(sorted_checks, 1):
-                    percentage = (check_time / total_time * 100) if total_time > 0 else 0
-                    f.write(f"{i:3d}. {check_name:<45} {check_time:8.3f}s ({percentage:5.1f}%)\n")
+            # Scale factor for the percentage columns, worked out once rather than per row
+            percent_scale = 100.0 / total_time if total_time > 0 else 0.0
+            top_10_time = math.fsum(check_time for _, check_time in top_10_checks)
+            
+            # Built up in memory and written once; there is a line per enabled check
+            parts = ["Clang-Tidy Performance Profile Summary\n",
+                     "=" * 50 + "\n\n",
+                     f"Total profile files analyzed: {len(profile_files)}\n",
+                     f"Total time spent in checks: {total_time:.3f} seconds\n\n",
+                     "Top 10 Most Expensive Checks:\n",
+                     "-" * 50 + "\n"]
+            
+            for i, (check_name, check_time) in enumerate(top_10_checks, 1):
+                percentage = check_time * percent_scale
+                parts.append(f"{i:2d}. {check_name:<40} {check_time:8.3f}s ({percentage:5.1f}%)\n")
+            
+            parts.append(f"\nRemaining {len(sorted_checks) - 10} checks: {total_time - top_10_time:.3f}s\n")
+            
+            # Add all checks for reference
+            parts.append(f"\nAll {len(sorted_checks)} checks (sorted by time):\n")
+            parts.append("-" * 70 + "\n")
+            for i, (check_name, check_time) in enumerate(sorted_checks, 1):
+                percentage = check_time * percent_scale
+                parts.append(f"{i:3d}. {check_name:<45} {check_time:8.3f}s ({percentage:5.1f}%)\n")
+            summary_file.write_text(''.join(parts), encoding='utf-8')
             
             # Show performance analysis if requested
             if show_performance_suggestions:
@@ -1422,22 +2069,19 @@ exit 0
                 if total_time > 5.0:
                     # Calculate which checks to remove to get under 5 seconds
                     target_time = 5.0
-                    cumulative_time = total_time
-                    checks_to_remove = []
-                    
-                    for check_name, check_time in sorted_checks:
-                        if cumulative_time <= target_time:
-                            break
-                        checks_to_remove.append((check_name, check_time))
-                        cumulative_time -= check_time
+                    # The slowest checks whose combined time covers the excess: the first prefix
+                    # sum reaching total - target marks the cut
+                    removed_prefix = list(itertools.accumulate(check_time for _, check_time in sorted_checks))
+                    cut = min(len(sorted_checks), bisect.bisect_left(removed_prefix, total_time - target_time) + 1)
+                    checks_to_remove = sorted_checks[:cut]
                     
                     if checks_to_remove:
-                        total_removed_time = sum(time for _, time in checks_to_remove)
+                        total_removed_time = removed_prefix[cut - 1]
                         remaining_time = total_time - total_removed_time
                         
                         print(f"To reduce lint time to <={target_time}s, consider disabling these checks:")
                         for i, (check_name, check_time) in enumerate(checks_to_remove, 1):
-                            percentage = (check_time / total_time * 100) if total_time > 0 else 0
+                            percentage = check_time * percent_scale
                             print(f"  {i:2d}. {check_name:<35} {check_time:6.3f}s ({percentage:4.1f}%)")
                         
                         print(f"Removing these {len(checks_to_remove)} checks would save {total_removed_time:.1f}s")
@@ -1488,52 +2132,45 @@ exit 0
         
         if args.copy_to_root:
             try:
-                import shutil
-                shutil.copy2(compile_commands_src, compile_commands_root)
-                self.logger.info(f"[OK] Copied compilation database to: {compile_commands_root}")
+                # copy2 preserves mtime, so a matching size and mtime means the root copy is current
+                src_stat = compile_commands_src.stat()
+                try:
+                    dst_stat = compile_commands_root.stat()
+                    up_to_date = (dst_stat.st_size, dst_stat.st_mtime_ns) == (src_stat.st_size, src_stat.st_mtime_ns)
+                except OSError:
+                    up_to_date = False
+                    
+                if up_to_date:
+                    self.logger.info(f"[OK] Compilation database at {compile_commands_root} is up to date")
+                else:
+                    # shutil.copy2 copies in the kernel where it can (sendfile on Linux, fcopyfile on macOS)
+                    shutil.copy2(compile_commands_src, compile_commands_root)
+                    self.logger.info(f"[OK] Copied compilation database to: {compile_commands_root}")
             except Exception as e:
                 self.logger.error(f"Failed to copy compilation database: {e}")
                 return 1
                 
         # Display statistics
         try:
-            import json
-            with open(compile_commands_src, 'r') as f:
-                compile_db = json.load(f)
-                
-            self.logger.info(f"Compilation database statistics:")
-            self.logger.info(f"  Total entries: {len(compile_db)}")
-            
-            # Count by file type
-            cpp_files = sum(1 for entry in compile_db if entry.get('file', '').endswith('.cpp'))
-            h_files = sum(1 for entry in compile_db if entry.get('file', '').endswith('.h'))
-            other_files = len(compile_db) - cpp_files - h_files
-            
-            self.logger.info(f"  C++ source files: {cpp_files}")
-            self.logger.info(f"  Header files: {h_files}")
-            if other_files > 0:
-                self.logger.info(f"  Other files: {other_files}")
-                
-            # Show unique directories
-            directories = set()
-            for entry in compile_db:
-                file_path = Path(entry.get('file', ''))
-                if file_path.is_absolute():
-                    directories.add(str(file_path.parent))
-                    
-            self.logger.info(f"  Source directories: {len(directories)}")
+            stats = self._load_compile_db_stats(compile_commands_src, build_dir / ".compile_commands.stats.pkl")
+            
+            # Emit the report in blocks; one logger call per line is slow for large databases
+            lines = [
+                "Compilation database statistics:",
+                f"  Total entries: {stats['total']}",
+                f"  C++ source files: {stats['cpp']}",
+                f"  Header files: {stats['h']}",
+            ]
+            if stats['other'] > 0:
+                lines.append(f"  Other files: {stats['other']}")
+            lines.append(f"  Source directories: {stats['dirs_count']}")
+            self.logger.info("\n".join(lines))
             
             if args.show_files:
                 self.logger.info("\nFiles in compilation database:")
-                for entry in compile_db:
-                    file_path = entry.get('file', '')
-                    if file_path:
-                        try:
-                            rel_path = Path(file_path).relative_to(self.project_root) if Path(file_path).is_absolute() else file_path
-                            self.logger.info(f"  {rel_path}")
-                        except ValueError:
-                            # Path is not relative to project root
-                            self.logger.info(f"  {file_path}")
+                files = stats['files']
+                for start in range(0, len(files), 1000):
+                    self.logger.info("\n".join(f"  {file_path}" for file_path in files[start:start + 1000]))
                         
         except Exception as e:
             self.logger.warning(f"Could not parse compilation database: {e}")
@@ -1541,6 +2178,89 @@ exit 0
         self.logger.info("[OK] Compilation database management completed!")
         return 0
 
+    def _load_compile_db_stats(self, compile_commands_src: Path, stats_file: Path) -> dict:
+        """Return statistics for a compilation database, reusing the cached copy while it is unchanged.
+        
+        The cache is keyed on the database's mtime and size, so parsing is skipped entirely on repeat runs.
+        """
+        st = compile_commands_src.stat()
+        cache_key = (st.st_mtime_ns, st.st_size, self.project_root_str, _CPP_SOURCE_EXTS, _CPP_HEADER_EXTS)
+        try:
+            with open(stats_file, 'rb') as f:
+                stats = pickle.load(f)
+            if stats.get('key') == cache_key:
+                return stats
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError):
+            pass
+            
+        total = cpp_files = h_files = other_files = 0
+        directories = set()
+        files = []
+        path_cache = {}
+        root_prefix = os.path.normcase(self.project_root_str + os.sep)
+        # orjson parses fastest; without it, stream entries with ijson so the database is never held in memory
+        with open(compile_commands_src, 'rb') as f:
+            # The database is read front to back once; let the kernel read ahead aggressively
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            if orjson and st.st_size:
+                # Parse straight from the mapped file instead of copying it into a read buffer first
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                    entries = orjson.loads(view)
+            elif orjson:
+                entries = orjson.loads(f.read())
+            elif ijson:
+                entries = ijson.items(f, 'item')
+            else:
+                entries = json.load(f)
+            for entry in entries:
+                total += 1
+                file_path = entry.get('file', '')
+                
+                # Count by file type
+                if file_path.endswith(_CPP_SOURCE_EXTS):
+                    cpp_files += 1
+                elif file_path.endswith(_CPP_HEADER_EXTS):
+                    h_files += 1
+                else:
+                    other_files += 1
+                    
+                if not os.path.isabs(file_path):
+                    if file_path:
+                        files.append(file_path)
+                    continue
+                    
+                # A file can appear once per translation unit, so resolve each path only once
+                resolved = path_cache.get(file_path)
+                if resolved is None:
+                    # String operations avoid building Path objects per entry
+                    norm_path = os.path.normpath(file_path)
+                    # Relative to the project root where possible, as shown by --show-files
+                    if os.path.normcase(norm_path).startswith(root_prefix):
+                        display_path = norm_path[len(root_prefix):]
+                    else:
+                        display_path = file_path
+                    # Interned so the many files sharing a directory share one string
+                    resolved = path_cache[file_path] = (sys.intern(os.path.dirname(norm_path)), display_path)
+                directories.add(resolved[0])
+                files.append(resolved[1])
+                        
+        stats = {
+            'key': cache_key,
+            'total': total,
+            'cpp': cpp_files,
+            'h': h_files,
+            'other': other_files,
+            'dirs_count': len(directories),
+            'files': files,
+        }
+        try:
+            with open(stats_file, 'wb') as f:
+                pickle.dump(stats, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            self.logger.warning(f"Failed to write compilation database stats cache {stats_file}: {e}")
+        return stats
+        
     def cmd_install_git_hooks(self, args):
         """Install git pre-commit hooks."""
 
@@ -1554,42 +2274,13 @@ exit 0
         pre_commit_hook = git_hooks_dir / "pre-commit"
         
         # Create pre-commit hook script
-        hook_content = '''#!/bin/sh
-# Pre-commit hook for code formatting checks
-
-echo "Running pre-commit formatting checks..."
-
-# Get list of staged C++ files
-STAGED_FILES=$(git diff --cached --name-only --diff-filter=ACM | grep -E "\\.(cpp|h|hpp)$" || true)
-
-if [ -z "$STAGED_FILES" ]; then
-    echo "[OK] No C++ files to check"
-    exit 0
-fi
-
-echo "Checking formatting for staged C++ files..."
-
-# Run format check
-please format --check-only --files $STAGED_FILES
-
-if [ $? -ne 0 ]; then
-    echo "[ERROR] Code formatting issues found!"
-    echo "Run 'please format' to fix formatting issues"
-    echo "Then stage the corrected files and commit again"
-    exit 1
-fi
-
-echo "[OK] All staged files are properly formatted"
-exit 0
-'''
+        hook_content = _PRE_COMMIT_HOOK_SCRIPT
         
         try:
-            with open(pre_commit_hook, 'w') as f:
-                f.write(hook_content)
+            pre_commit_hook.write_text(hook_content, encoding='utf-8')
                 
             # Make executable (Unix-like systems)
-            if not self.platform_info.is_windows:
-                import stat
+            if not self._is_windows:
                 pre_commit_hook.chmod(pre_commit_hook.stat().st_mode | stat.S_IEXEC)
                 
             self.logger.info("[OK] Pre-commit hook installed successfully!")
@@ -1624,26 +2315,26 @@ exit 0
         cmd.extend(["--test-dir", str(build_dir)])
         
         # Add parallel execution if specified
-        if hasattr(args, 'parallel') and args.parallel:
-            if args.parallel == "auto":
-                import multiprocessing
-                parallel_count = multiprocessing.cpu_count()
+        parallel = getattr(args, 'parallel', None)
+        if parallel:
+            if parallel == "auto":
+                parallel_count = _CPU_COUNT
             else:
                 try:
-                    parallel_count = int(args.parallel)
+                    parallel_count = int(parallel)
                 except ValueError:
-                    self.logger.error(f"Invalid parallel count: {args.parallel}")
+                    self.logger.error(f"Invalid parallel count: {parallel}")
                     return 1
             cmd.extend(["--parallel", str(parallel_count)])
         
         # Add verbosity
-        if hasattr(args, 'verbose') and args.verbose:
+        if getattr(args, 'verbose', False):
             cmd.append("--verbose")
         else:
             cmd.append("--output-on-failure")
         
         # Add specific test target if specified
-        if hasattr(args, 'target') and args.target:
+        if getattr(args, 'target', None):
             cmd.extend(["--tests-regex", args.target])
         
         # Add output format for CI/reporting
@@ -1651,7 +2342,7 @@ exit 0
         cmd.extend(["--output-junit", str(junit_output)])
         
         # Add test labels filter if specified
-        if hasattr(args, 'labels') and args.labels:
+        if getattr(args, 'labels', None):
             cmd.extend(["--label-regex", args.labels])
         
         # Execute CTest with concise output
@@ -1659,28 +2350,30 @@ exit 0
         
         # Save detailed test output
         test_output_file = test_log_dir / "test-output.log"
-        with open(test_output_file, 'w', encoding='utf-8') as f:
-            f.write(f"Test Command: {' '.join(cmd)}\n")
-            f.write(f"Working Directory: {build_dir}\n")
-            f.write(f"Return Code: {result.returncode}\n\n")
-            f.write("=== STDOUT ===\n")
-            f.write(result.stdout or "")
-            f.write("\n=== STDERR ===\n")
-            f.write(result.stderr or "")
+        test_output_file.write_text(f"Test Command: {' '.join(cmd)}\n"
+                                    f"Working Directory: {build_dir}\n"
+                                    f"Return Code: {result.returncode}\n\n"
+                                    "=== STDOUT ===\n"
+                                    f"{result.stdout or ''}"
+                                    "\n=== STDERR ===\n"
+                                    f"{result.stderr or ''}", encoding='utf-8')
+        
+        # One timestamp for the run, shared by every report written below
+        run_time = datetime.now()
         
         # Parse and display test results
-        test_stats = self._analyze_test_results(result, test_log_dir, junit_output)
+        test_stats = self._analyze_test_results(result, test_log_dir, junit_output, run_time)
         
         # Generate enhanced reports
-        self._generate_enhanced_test_reports(args, test_log_dir, junit_output, test_stats, result)
+        self._generate_enhanced_test_reports(args, test_log_dir, junit_output, test_stats, result, run_time)
         
         # Handle coverage if requested
-        if hasattr(args, 'coverage') and args.coverage:
-            self._handle_test_coverage(test_log_dir, build_dir)
+        if getattr(args, 'coverage', False):
+            self._handle_test_coverage(test_log_dir, build_dir, run_time)
         
         # Historical tracking
-        if hasattr(args, 'historical') and args.historical:
-            self._update_test_history(test_log_dir, test_stats, result.returncode)
+        if getattr(args, 'historical', False):
+            self._update_test_history(test_log_dir, test_stats, result.returncode, run_time)
         
         if result.returncode == 0:
             self.logger.info("[OK] All tests passed")
@@ -1688,8 +2381,8 @@ exit 0
             self.logger.info(f"Test output saved to: {test_output_file}")
             
             # Additional success reporting for CI/CD
-            if hasattr(args, 'ci_mode') and args.ci_mode:
-                self._generate_ci_test_summary(test_log_dir, junit_output)
+            if getattr(args, 'ci_mode', False):
+                self._generate_ci_test_summary(test_log_dir, junit_output, run_time)
             
             return 0
         else:
@@ -1699,19 +2392,17 @@ exit 0
                 self.logger.info(f"Test results saved to: {junit_output}")
             
             # Generate failure report for CI/CD
-            if hasattr(args, 'ci_mode') and args.ci_mode:
-                self._generate_ci_failure_report(test_log_dir, result)
+            if getattr(args, 'ci_mode', False):
+                self._generate_ci_failure_report(test_log_dir, result, run_time)
             
             return 1
     
-    def _generate_ci_test_summary(self, test_log_dir: Path, junit_output: Path):
+    def _generate_ci_test_summary(self, test_log_dir: Path, junit_output: Path, run_time: datetime):
         """Generate CI-friendly test summary."""
         ci_summary = test_log_dir / "ci-summary.json"
-        import json
-        from datetime import datetime
         
         summary_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": run_time.isoformat(),
             "status": "success",
             "junit_report": str(junit_output.relative_to(self.project_root)),
             "total_tests": 0,
@@ -1723,53 +2414,62 @@ exit 0
         # Parse JUnit XML if available
         if junit_output.exists():
             try:
-                import xml.etree.ElementTree as ET
-                tree = ET.parse(junit_output)
-                root = tree.getroot()
-                
-                # Extract test statistics from JUnit XML
-                if root.tag == 'testsuites':
-                    for testsuite in root.findall('testsuite'):
-                        summary_data["total_tests"] += int(testsuite.get('tests', 0))
-                        summary_data["failed_tests"] += int(testsuite.get('failures', 0))
-                        summary_data["execution_time"] += float(testsuite.get('time', 0))
+                # Extract test statistics from JUnit XML. Streamed: only the <testsuite> children
+                # of a <testsuites> root are needed, and each is cleared once counted.
+                depth = 0
+                root_tag = None
+                total_tests = failed_tests = 0
+                execution_time = 0
+                for event, elem in ET.iterparse(junit_output, events=('start', 'end')):
+                    if event == 'start':
+                        if depth == 0:
+                            root_tag = elem.tag
+                        depth += 1
+                        continue
+                    depth -= 1
+                    if depth != 1:
+                        continue
+                    if root_tag == 'testsuites' and elem.tag == 'testsuite':
+                        total_tests += int(elem.get('tests', 0))
+                        failed_tests += int(elem.get('failures', 0))
+                        execution_time += float(elem.get('time', 0))
+                    elem.clear()
                 
-                summary_data["passed_tests"] = summary_data["total_tests"] - summary_data["failed_tests"]
+                # Only filled in once the whole file parsed, so a truncated report records nothing
+                summary_data["total_tests"] = total_tests
+                summary_data["failed_tests"] = failed_tests
+                summary_data["execution_time"] = execution_time
+                summary_data["passed_tests"] = total_tests - failed_tests
                         
             except Exception as e:
                 self.logger.warning(f"Could not parse JUnit XML: {e}")
         
-        with open(ci_summary, 'w', encoding='utf-8') as f:
-            json.dump(summary_data, f, indent=2)
+        _write_json_file(ci_summary, summary_data, indent=True)
         
         self.logger.info(f"CI summary saved to: {ci_summary}")
     
-    def _generate_ci_failure_report(self, test_log_dir: Path, result):
+    def _generate_ci_failure_report(self, test_log_dir: Path, result, run_time: datetime):
         """Generate CI-friendly failure report."""
         ci_failure = test_log_dir / "ci-failure.json"
-        import json
-        from datetime import datetime
         
         failure_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": run_time.isoformat(),
             "status": "failure",
             "return_code": result.returncode,
             "stderr": result.stderr or "",
             "stdout": result.stdout or ""
         }
         
-        with open(ci_failure, 'w', encoding='utf-8') as f:
-            json.dump(failure_data, f, indent=2)
+        _write_json_file(ci_failure, failure_data, indent=True)
         
         self.logger.info(f"CI failure report saved to: {ci_failure}")
     
-    def _analyze_test_results(self, result, test_log_dir: Path, junit_output: Path):
+    def _analyze_test_results(self, result, test_log_dir: Path, junit_output: Path, run_time: datetime):
         """Analyze and summarize test results."""
         # Parse basic results from CTest output
         stdout = result.stdout or ""
         
         # Extract test summary from CTest output
-        lines = stdout.split('\n')
         test_summary = {
             'total': 0,
             'passed': 0,
@@ -1779,24 +2479,27 @@ exit 0
             'individual_tests': []
         }
         
-        import re
-        for line in lines:
-            if "tests passed" in line.lower():
+        # Iterated through io.StringIO so a long CTest log isn't split into a second full-size list;
+        # the trailing newline each line keeps doesn't affect any of the matches below
+        for line in io.StringIO(stdout):
+            if line[0] not in _CTEST_LINE_STARTS:
+                continue
+            if "% tests passed," in line:
                 # Parse lines like "100% tests passed, 0 tests failed out of 3"
-                match = re.search(r'(\d+)% tests passed, (\d+) tests failed out of (\d+)', line)
+                match = _CTEST_PASSED_RE.search(line)
                 if match:
                     test_summary['passed_percent'] = int(match.group(1))
                     test_summary['failed'] = int(match.group(2))
                     test_summary['total'] = int(match.group(3))
                     test_summary['passed'] = test_summary['total'] - test_summary['failed']
-            elif "Total Test time" in line:
+            elif line.startswith("Total Test time"):
                 # Parse "Total Test time (real) =   0.02 sec"
-                match = re.search(r'Total Test time.*?=\s*([0-9.]+)', line)
+                match = _CTEST_TOTAL_TIME_RE.match(line)
                 if match:
                     test_summary['execution_time'] = float(match.group(1))
-            elif re.match(r'\d+/\d+ Test #\d+:', line):
+            else:
                 # Parse individual test results: "1/3 Test #1: Dosatsu_SelfTest ............... Passed 0.01 sec"
-                match = re.match(r'(\d+)/(\d+) Test #(\d+):\s*(\S+)\s*\.+\s*(\w+)\s*([0-9.]+)', line)
+                match = _CTEST_RESULT_RE.match(line)
                 if match:
                     test_info = {
                         'index': int(match.group(1)),
@@ -1817,36 +2520,33 @@ exit 0
         
         # Save summary to file
         summary_file = test_log_dir / "test-summary.txt"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            f.write("TEST EXECUTION SUMMARY\n")
-            f.write("=" * 50 + "\n\n")
-            
-            if test_summary['total'] > 0:
-                f.write(f"Total Tests: {test_summary['total']}\n")
-                f.write(f"Passed: {test_summary['passed']} ({test_summary['passed_percent']}%)\n")
-                f.write(f"Failed: {test_summary['failed']}\n")
-                f.write(f"Execution Time: {test_summary['execution_time']:.2f} seconds\n\n")
-                
-                # Individual test details
-                if test_summary['individual_tests']:
-                    f.write("INDIVIDUAL TEST RESULTS\n")
-                    f.write("-" * 30 + "\n")
-                    for test in test_summary['individual_tests']:
-                        f.write(f"{test['name']}: {test['status']} ({test['duration']:.3f}s)\n")
-                    f.write("\n")
-            
-            f.write("Return Code: " + str(result.returncode) + "\n")
-            f.write("Status: " + ("PASSED" if result.returncode == 0 else "FAILED") + "\n")
-            
-            # Add timestamp
-            from datetime import datetime
-            f.write(f"Execution Time: {datetime.now().isoformat()}\n")
+        parts = ["TEST EXECUTION SUMMARY\n", "=" * 50 + "\n\n"]
+        
+        if test_summary['total'] > 0:
+            parts.append(f"Total Tests: {test_summary['total']}\n"
+                         f"Passed: {test_summary['passed']} ({test_summary['passed_percent']}%)\n"
+                         f"Failed: {test_summary['failed']}\n"
+                         f"Execution Time: {test_summary['execution_time']:.2f} seconds\n\n")
+            
+            # Individual test details
+            if test_summary['individual_tests']:
+                parts.append("INDIVIDUAL TEST RESULTS\n")
+                parts.append("-" * 30 + "\n")
+                for test in test_summary['individual_tests']:
+                    parts.append(f"{test['name']}: {test['status']} ({test['duration']:.3f}s)\n")
+                parts.append("\n")
+        
+        parts.append("Return Code: " + str(result.returncode) + "\n")
+        parts.append("Status: " + ("PASSED" if result.returncode == 0 else "FAILED") + "\n")
+        
+        # Add timestamp
+        parts.append(f"Execution Time: {run_time.isoformat()}\n")
+        summary_file.write_text(''.join(parts), encoding='utf-8')
         
         return test_summary
 
-    def _generate_enhanced_test_reports(self, args, test_log_dir: Path, junit_output: Path, test_stats: dict, result):
+    def _generate_enhanced_test_reports(self, args, test_log_dir: Path, junit_output: Path, test_stats: dict, result, run_time: datetime):
         """Generate enhanced test reports in multiple formats."""
-        from datetime import datetime
         
         # Determine report format
         report_format = getattr(args, 'report_format', 'auto')
@@ -1855,20 +2555,20 @@ exit 0
         
         # Generate HTML report
         if report_format in ['auto', 'html']:
-            self._generate_html_test_report(test_log_dir, test_stats, result)
+            self._generate_html_test_report(test_log_dir, test_stats, result, run_time)
         
         # Generate JSON report
         if report_format in ['auto', 'json']:
-            self._generate_json_test_report(test_log_dir, test_stats, result)
+            self._generate_json_test_report(test_log_dir, test_stats, result, run_time)
     
-    def _generate_html_test_report(self, test_log_dir: Path, test_stats: dict, result):
+    def _generate_html_test_report(self, test_log_dir: Path, test_stats: dict, result, run_time: datetime):
         """Generate HTML test report."""
-        from datetime import datetime
         
         html_file = test_log_dir / "test-report.html"
+        generated_at = run_time.strftime('%Y-%m-%d %H:%M:%S')
         
-        # Generate HTML content
-        html_content = f"""<!DOCTYPE html>
+        # Generate HTML content as fragments joined once; += on the page would copy it per test
+        parts = [f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -1926,44 +2626,41 @@ exit 0
         
         <div class="test-details">
             <h2>Individual Test Results</h2>
-"""
+"""]
         
         if test_stats['individual_tests']:
             for test in test_stats['individual_tests']:
                 status_class = 'passed' if test['status'].lower() == 'passed' else 'failed'
-                html_content += f"""
+                parts.append(f"""
             <div class="test-item {status_class}">
                 <div class="test-name">{test['name']}</div>
                 <div class="test-duration">Duration: {test['duration']:.3f} seconds | Status: {test['status']}</div>
-            </div>"""
+            </div>""")
         else:
-            html_content += "<p>No individual test details available.</p>"
+            parts.append("<p>No individual test details available.</p>")
         
-        html_content += f"""
+        parts.append(f"""
         </div>
         
         <div class="timestamp">
-            Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+            Generated on {generated_at}
         </div>
     </div>
 </body>
-</html>"""
+</html>""")
         
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        html_file.write_text(''.join(parts), encoding='utf-8')
         
         self.logger.info(f"HTML test report saved to: {html_file}")
     
-    def _generate_json_test_report(self, test_log_dir: Path, test_stats: dict, result):
+    def _generate_json_test_report(self, test_log_dir: Path, test_stats: dict, result, run_time: datetime):
         """Generate JSON test report."""
-        import json
-        from datetime import datetime
         
         json_file = test_log_dir / "test-report.json"
         
         report_data = {
             "metadata": {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": run_time.isoformat(),
                 "project": "Dosatsu",
                 "build_system": "CMake + CTest",
                 "return_code": result.returncode,
@@ -1984,12 +2681,11 @@ exit 0
             }
         }
         
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2)
+        _write_json_file(json_file, report_data, indent=True)
         
         self.logger.info(f"JSON test report saved to: {json_file}")
     
-    def _handle_test_coverage(self, test_log_dir: Path, build_dir: Path):
+    def _handle_test_coverage(self, test_log_dir: Path, build_dir: Path, run_time: datetime):
         """Handle test coverage collection if available."""
         coverage_dir = test_log_dir / "coverage"
         self.ensure_directory(coverage_dir)
@@ -2018,24 +2714,21 @@ exit 0
             
         # Create coverage placeholder
         coverage_info = coverage_dir / "coverage-info.txt"
-        with open(coverage_info, 'w', encoding='utf-8') as f:
-            from datetime import datetime
-            f.write("COVERAGE COLLECTION REPORT\n")
-            f.write("=" * 40 + "\n\n")
-            f.write(f"Timestamp: {datetime.now().isoformat()}\n")
-            f.write(f"Available tool: {available_tool or 'None'}\n")
-            f.write("Status: Coverage collection is available but requires manual setup\n")
-            f.write("For detailed coverage, consider integrating gcov/llvm-cov in CMake configuration\n")
+        coverage_info.write_text("COVERAGE COLLECTION REPORT\n"
+                                 + "=" * 40 + "\n\n"
+                                 f"Timestamp: {run_time.isoformat()}\n"
+                                 f"Available tool: {available_tool or 'None'}\n"
+                                 "Status: Coverage collection is available but requires manual setup\n"
+                                 "For detailed coverage, consider integrating gcov/llvm-cov in CMake configuration\n",
+                                 encoding='utf-8')
     
     def _collect_windows_coverage(self, coverage_dir: Path, build_dir: Path):
         """Collect coverage using OpenCppCoverage on Windows."""
         # This is a placeholder for OpenCppCoverage integration
         self.logger.info("Windows coverage collection would be implemented here")
         
-    def _update_test_history(self, test_log_dir: Path, test_stats: dict, return_code: int):
+    def _update_test_history(self, test_log_dir: Path, test_stats: dict, return_code: int, run_time: datetime):
         """Update historical test tracking."""
-        import json
-        from datetime import datetime
         
         history_file = test_log_dir / "test-history.json"
         history_data = []
@@ -2043,14 +2736,13 @@ exit 0
         # Load existing history
         if history_file.exists():
             try:
-                with open(history_file, 'r', encoding='utf-8') as f:
-                    history_data = json.load(f)
+                history_data = _read_json_file(history_file)
             except Exception as e:
                 self.logger.warning(f"Could not load test history: {e}")
         
         # Add current results
         current_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": run_time.isoformat(),
             "total_tests": test_stats['total'],
             "passed_tests": test_stats['passed'],
             "failed_tests": test_stats['failed'],
@@ -2066,8 +2758,7 @@ exit 0
         history_data = history_data[-100:]
         
         # Save updated history
-        with open(history_file, 'w', encoding='utf-8') as f:
-            json.dump(history_data, f, indent=2)
+        _write_json_file(history_file, history_data, indent=True)
         
         self.logger.info(f"Test history updated: {len(history_data)} entries")
         
@@ -2264,12 +2955,10 @@ exit 0
                 if result.returncode == 0:
                     first_line = result.stdout.split('\n')[0] if result.stdout else ''
                     if '[ahead' in first_line:
-                        import re
                         match = re.search(r'ahead (\d+)', first_line)
                         if match:
                             status_info['commits_ahead'] = int(match.group(1))
                     if '[behind' in first_line:
-                        import re
                         match = re.search(r'behind (\d+)', first_line)
                         if match:
                             status_info['commits_behind'] = int(match.group(1))
@@ -2579,15 +3268,13 @@ exit 0
         # Get timestamps
         cmake_cache = build_dir / "CMakeCache.txt"
         if cmake_cache.exists():
-            import datetime
-            config_time = datetime.datetime.fromtimestamp(cmake_cache.stat().st_mtime)
+            config_time = datetime.fromtimestamp(cmake_cache.stat().st_mtime)
             stats['config_time'] = config_time.strftime("%Y-%m-%d %H:%M:%S")
         
         # Check for build artifacts
         ninja_build = build_dir / "build.ninja"
         if ninja_build.exists():
-            import datetime
-            build_time = datetime.datetime.fromtimestamp(ninja_build.stat().st_mtime)
+            build_time = datetime.fromtimestamp(ninja_build.stat().st_mtime)
             stats['last_build'] = build_time.strftime("%Y-%m-%d %H:%M:%S")
         
         return stats
@@ -2613,7 +3300,6 @@ exit 0
             return "0 B"
         
         size_names = ["B", "KB", "MB", "GB", "TB"]
-        import math
         i = int(math.floor(math.log(size_bytes, 1024)))
         p = math.pow(1024, i)
         s = round(size_bytes / p, 2)
@@ -2682,7 +3368,6 @@ exit 0
             self.logger.info("\nCleaning CMake caches...")
             for name, path in cache_dirs:
                 if "CMake" in name:
-                    import shutil
                     try:
                         shutil.rmtree(path)
                         self.logger.info(f"  Cleaned: {name}")
@@ -2693,7 +3378,6 @@ exit 0
             self.logger.info("\nCleaning dependency caches...")
             for name, path in cache_dirs:
                 if "Dependencies" in name:
-                    import shutil
                     try:
                         shutil.rmtree(path)
                         self.logger.info(f"  Cleaned: {name}")
@@ -2708,8 +3392,155 @@ exit 0
         return 0
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create and configure the argument parser."""
+def _add_configure_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the configure command arguments to parser."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--debug', action='store_true', help='Configure for debug build')
+    group.add_argument('--release', action='store_true', help='Configure for release build')
+    parser.add_argument('--clean', action='store_true', help='Clean configure from scratch')
+
+
+def _add_build_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the build command arguments to parser."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--debug', action='store_true', help='Build debug version')
+    group.add_argument('--release', action='store_true', help='Build release version')
+    parser.add_argument('--target', help='Build specific target')
+    parser.add_argument('--parallel', type=int, help='Number of parallel jobs')
+
+
+def _add_test_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the test command arguments to parser."""
+    parser.add_argument('--debug', action='store_true', help='Run tests for debug build')
+    parser.add_argument('--release', action='store_true', help='Run tests for release build')
+    parser.add_argument('--parallel', default="auto", help='Number of parallel test jobs (default: auto)')
+    parser.add_argument('--verbose', action='store_true', help='Verbose test output')
+    parser.add_argument('--target', help='Run specific test (regex pattern)')
+    parser.add_argument('--labels', help='Run tests with specific labels (regex pattern)')
+    parser.add_argument('--ci-mode', action='store_true', help='Enable CI-friendly output and reporting')
+    parser.add_argument('--coverage', action='store_true', help='Enable test coverage collection (if available)')
+    parser.add_argument('--report-format', choices=['auto', 'html', 'json', 'text'], default='auto', help='Test report format')
+    parser.add_argument('--historical', action='store_true', help='Enable historical test result tracking')
+
+
+def _add_format_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the format command arguments to parser."""
+    parser.add_argument('--check-only', action='store_true', help='Check formatting without changes')
+    parser.add_argument('--files', nargs='*', help='Specific files to format')
+    parser.add_argument('--no-cache', action='store_true', help='Process all files, even those unchanged since the last clean run')
+
+
+def _add_lint_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments shared by the lint and full-lint commands to parser."""
+    parser.add_argument('--files', nargs='*', help='Specific files to lint')
+    parser.add_argument('--target', help='Lint specific file')
+    parser.add_argument('--summary-only', action='store_true', help='Show only summary, skip detailed output (the report lists counts but not individual issues)')
+    parser.add_argument('--report-format', choices=['text', 'markdown'], default='markdown', help='Report format for generated files')
+    parser.add_argument('--fast', action='store_true', help='Fast mode: skip Phase 2 analysis (auto-fix only)')
+    parser.add_argument('--per-file', action='store_true', help='Process files individually with progress reporting (default)')
+    parser.add_argument('--batch', action='store_true', help='Process all files in batch mode (faster but less responsive)')
+    parser.add_argument('--no-cache', action='store_true', help='Lint all files, even those unchanged since the last clean run')
+    parser.add_argument('--changed-only', action='store_true', help='Only lint sources changed since HEAD (all of them if .clang-tidy changed)')
+    parser.add_argument('--incremental', action='store_true', help='Only lint sources that missed ccache in the last build (needs CCACHE_LOGFILE=artifacts/debug/ccache.log and CCACHE_EXTRAFILES=.clang-tidy)')
+    parser.add_argument('-j', '--jobs', type=int, help='Number of clang-tidy processes to run at once (default: CPU count, limited by free memory)')
+
+
+def _add_compile_db_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the compile-db command arguments to parser."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--debug', action='store_true', help='Use debug build database')
+    group.add_argument('--release', action='store_true', help='Use release build database')
+    parser.add_argument('--copy-to-root', action='store_true', help='Copy database to project root')
+    parser.add_argument('--show-files', action='store_true', help='Show all files in database')
+
+
+def _add_rebuild_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the rebuild command arguments to parser."""
+    parser.add_argument('--debug', action='store_true', help='Use debug build type')
+    parser.add_argument('--release', action='store_true', help='Use release build type')
+    parser.add_argument('--parallel', type=int, help='Number of parallel build jobs')
+    parser.add_argument('--skip-tests', action='store_true', help='Skip test execution after rebuild')
+    parser.add_argument('--test-target', help='Run specific test pattern after build')
+
+
+def _add_reconfigure_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the reconfigure command arguments to parser."""
+    parser.add_argument('--debug', action='store_true', help='Configure for debug build')
+    parser.add_argument('--release', action='store_true', help='Configure for release build')
+
+
+def _add_git_pull_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the git-pull command arguments to parser."""
+    parser.add_argument('--check-clean', action='store_true', help='Check for clean working directory before pulling')
+    parser.add_argument('--rebase', action='store_true', help='Use rebase instead of merge')
+    parser.add_argument('--skip-rebuild-suggestion', action='store_true', help='Skip rebuild suggestion after pull')
+
+
+def _add_git_push_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the git-push command arguments to parser."""
+    parser.add_argument('--allow-dirty', action='store_true', help='Allow push with uncommitted changes')
+    parser.add_argument('--force', action='store_true', help='Force push (use with caution)')
+    parser.add_argument('--set-upstream', action='store_true', help='Set upstream branch')
+
+
+def _add_git_commit_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the git-commit command arguments to parser."""
+    parser.add_argument('-m', '--message', help='Commit message')
+    parser.add_argument('--amend', action='store_true', help='Amend the previous commit')
+    parser.add_argument('--skip-checks', action='store_true', help='Skip pre-commit checks')
+    parser.add_argument('--skip-format-check', action='store_true', help='Skip formatting check')
+    parser.add_argument('--skip-build-check', action='store_true', help='Skip build check')
+    parser.add_argument('--force', action='store_true', help='Force commit even if checks fail')
+
+
+def _add_git_clean_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the git-clean command arguments to parser."""
+    parser.add_argument('--force', action='store_true', help='Actually clean files (default is dry-run)')
+    parser.add_argument('--interactive', action='store_true', help='Interactive clean mode')
+    parser.add_argument('--include-directories', action='store_true', help='Also clean untracked directories')
+    parser.add_argument('--include-ignored', action='store_true', help='Also clean ignored files')
+    parser.add_argument('--include-build-artifacts', action='store_true', help='Also clean build artifacts')
+
+
+def _add_cache_mgmt_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the cache-mgmt command arguments to parser."""
+    parser.add_argument('--clean-cmake', action='store_true', help='Clean CMake cache files')
+    parser.add_argument('--clean-deps', action='store_true', help='Clean dependency cache files')
+    parser.add_argument('--optimize', action='store_true', help='Optimize cache storage')
+
+
+# Command name -> (help text, argument setup or None, BuildOrchestrator handler name)
+_COMMANDS = {
+    'setup': ('Initial environment setup', None, 'cmd_setup'),
+    'info': ('Display build environment info', None, 'cmd_info'),
+    'configure': ('Configure build system', _add_configure_arguments, 'cmd_configure'),
+    'build': ('Build the project', _add_build_arguments, 'cmd_build'),
+    'clean': ('Clean build artifacts', None, 'cmd_clean'),
+    'test': ('Run tests using CTest', _add_test_arguments, 'cmd_test'),
+    'format': ('Format source code', _add_format_arguments, 'cmd_format'),
+    'lint': ('Fast lint with slow checks disabled', _add_lint_arguments, 'cmd_lint'),
+    'full-lint': ('Full lint with all checks enabled and profiling', _add_lint_arguments, 'cmd_full_lint'),
+    'compile-db': ('Generate and manage compilation database', _add_compile_db_arguments, 'cmd_compile_db'),
+    'install-git-hooks': ('Install git pre-commit hooks', None, 'cmd_install_git_hooks'),
+    'rebuild': ('Clean, build, and test in sequence', _add_rebuild_arguments, 'cmd_rebuild'),
+    'reconfigure': ('Clean configure from scratch', _add_reconfigure_arguments, 'cmd_reconfigure'),
+    'git-status': ('Display comprehensive git repository status', None, 'cmd_git_status'),
+    'git-pull': ('Pull latest changes from remote repository', _add_git_pull_arguments, 'cmd_git_pull'),
+    'git-push': ('Push local commits to remote repository', _add_git_push_arguments, 'cmd_git_push'),
+    'git-commit': ('Commit staged changes with pre-commit checks', _add_git_commit_arguments, 'cmd_git_commit'),
+    'git-clean': ('Clean git repository and build artifacts', _add_git_clean_arguments, 'cmd_git_clean'),
+    'build-stats': ('Display build statistics and performance analysis', None, 'cmd_build_stats'),
+    'cache-mgmt': ('Manage build caches and temporary files', _add_cache_mgmt_arguments, 'cmd_cache_management'),
+}
+
+
+def create_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Create and configure the argument parser.
+    
+    When command names a known subcommand only its subparser is built, since the others
+    can never be used by this invocation. Otherwise every subcommand is registered so help
+    and error messages list them all.
+    """
     parser = argparse.ArgumentParser(
         description="Dosatsu Build Orchestrator",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -2738,134 +3569,19 @@ Note: Use 'please.bat' on Windows or './please' on Unix/Linux/macOS
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
-    # Setup command
-    setup_parser = subparsers.add_parser('setup', help='Initial environment setup')
-    
-    # Info command
-    info_parser = subparsers.add_parser('info', help='Display build environment info')
-    
-    # Configure command
-    config_parser = subparsers.add_parser('configure', help='Configure build system')
-    config_group = config_parser.add_mutually_exclusive_group()
-    config_group.add_argument('--debug', action='store_true', help='Configure for debug build')
-    config_group.add_argument('--release', action='store_true', help='Configure for release build')
-    config_parser.add_argument('--clean', action='store_true', help='Clean configure from scratch')
-    
-    # Build command
-    build_parser = subparsers.add_parser('build', help='Build the project')
-    build_group = build_parser.add_mutually_exclusive_group()
-    build_group.add_argument('--debug', action='store_true', help='Build debug version')
-    build_group.add_argument('--release', action='store_true', help='Build release version')
-    build_parser.add_argument('--target', help='Build specific target')
-    build_parser.add_argument('--parallel', type=int, help='Number of parallel jobs')
-    
-    # Clean command
-    clean_parser = subparsers.add_parser('clean', help='Clean build artifacts')
-    
-    # Test command
-    test_parser = subparsers.add_parser('test', help='Run tests using CTest')
-    test_parser.add_argument('--debug', action='store_true', help='Run tests for debug build')
-    test_parser.add_argument('--release', action='store_true', help='Run tests for release build')
-    test_parser.add_argument('--parallel', default="auto", help='Number of parallel test jobs (default: auto)')
-    test_parser.add_argument('--verbose', action='store_true', help='Verbose test output')
-    test_parser.add_argument('--target', help='Run specific test (regex pattern)')
-    test_parser.add_argument('--labels', help='Run tests with specific labels (regex pattern)')
-    test_parser.add_argument('--ci-mode', action='store_true', help='Enable CI-friendly output and reporting')
-    test_parser.add_argument('--coverage', action='store_true', help='Enable test coverage collection (if available)')
-    test_parser.add_argument('--report-format', choices=['auto', 'html', 'json', 'text'], default='auto', help='Test report format')
-    test_parser.add_argument('--historical', action='store_true', help='Enable historical test result tracking')
-    
-    # Format command
-    format_parser = subparsers.add_parser('format', help='Format source code')
-    format_parser.add_argument('--check-only', action='store_true', help='Check formatting without changes')
-    format_parser.add_argument('--files', nargs='*', help='Specific files to format')
-    
-    # Lint command
-    lint_parser = subparsers.add_parser('lint', help='Fast lint with slow checks disabled')
-    lint_parser.add_argument('--files', nargs='*', help='Specific files to lint')
-    lint_parser.add_argument('--target', help='Lint specific file')
-    lint_parser.add_argument('--summary-only', action='store_true', help='Show only summary, skip detailed output')
-    lint_parser.add_argument('--report-format', choices=['text', 'markdown'], default='markdown', help='Report format for generated files')
-    lint_parser.add_argument('--fast', action='store_true', help='Fast mode: skip Phase 2 analysis (auto-fix only)')
-    lint_parser.add_argument('--per-file', action='store_true', help='Process files individually with progress reporting (default)')
-    lint_parser.add_argument('--batch', action='store_true', help='Process all files in batch mode (faster but less responsive)')
-    
-    # Full-lint command (all checks enabled)
-    full_lint_parser = subparsers.add_parser('full-lint', help='Full lint with all checks enabled and profiling')
-    full_lint_parser.add_argument('--files', nargs='*', help='Specific files to lint')
-    full_lint_parser.add_argument('--target', help='Lint specific file')
-    full_lint_parser.add_argument('--summary-only', action='store_true', help='Show only summary, skip detailed output')
-    full_lint_parser.add_argument('--report-format', choices=['text', 'markdown'], default='markdown', help='Report format for generated files')
-    full_lint_parser.add_argument('--fast', action='store_true', help='Fast mode: skip Phase 2 analysis (auto-fix only)')
-    full_lint_parser.add_argument('--per-file', action='store_true', help='Process files individually with progress reporting (default)')
-    full_lint_parser.add_argument('--batch', action='store_true', help='Process all files in batch mode (faster but less responsive)')
-    
-    # Compilation Database command
-    compile_db_parser = subparsers.add_parser('compile-db', help='Generate and manage compilation database')
-    compile_db_group = compile_db_parser.add_mutually_exclusive_group()
-    compile_db_group.add_argument('--debug', action='store_true', help='Use debug build database')
-    compile_db_group.add_argument('--release', action='store_true', help='Use release build database')
-    compile_db_parser.add_argument('--copy-to-root', action='store_true', help='Copy database to project root')
-    compile_db_parser.add_argument('--show-files', action='store_true', help='Show all files in database')
-    
-    # Git Integration Commands
-    git_hooks_parser = subparsers.add_parser('install-git-hooks', help='Install git pre-commit hooks')
-    
-    # Integrated workflow commands
-    rebuild_parser = subparsers.add_parser('rebuild', help='Clean, build, and test in sequence')
-    rebuild_parser.add_argument('--debug', action='store_true', help='Use debug build type')
-    rebuild_parser.add_argument('--release', action='store_true', help='Use release build type')
-    rebuild_parser.add_argument('--parallel', type=int, help='Number of parallel build jobs')
-    rebuild_parser.add_argument('--skip-tests', action='store_true', help='Skip test execution after rebuild')
-    rebuild_parser.add_argument('--test-target', help='Run specific test pattern after build')
-
-    # Reconfigure command (clean configure from scratch)
-    reconfig_parser = subparsers.add_parser('reconfigure', help='Clean configure from scratch')
-    reconfig_parser.add_argument('--debug', action='store_true', help='Configure for debug build')
-    reconfig_parser.add_argument('--release', action='store_true', help='Configure for release build')
-    
-    # Git Integration Commands
-    git_status_parser = subparsers.add_parser('git-status', help='Display comprehensive git repository status')
-    
-    git_pull_parser = subparsers.add_parser('git-pull', help='Pull latest changes from remote repository')
-    git_pull_parser.add_argument('--check-clean', action='store_true', help='Check for clean working directory before pulling')
-    git_pull_parser.add_argument('--rebase', action='store_true', help='Use rebase instead of merge')
-    git_pull_parser.add_argument('--skip-rebuild-suggestion', action='store_true', help='Skip rebuild suggestion after pull')
-    
-    git_push_parser = subparsers.add_parser('git-push', help='Push local commits to remote repository')
-    git_push_parser.add_argument('--allow-dirty', action='store_true', help='Allow push with uncommitted changes')
-    git_push_parser.add_argument('--force', action='store_true', help='Force push (use with caution)')
-    git_push_parser.add_argument('--set-upstream', action='store_true', help='Set upstream branch')
-    
-    git_commit_parser = subparsers.add_parser('git-commit', help='Commit staged changes with pre-commit checks')
-    git_commit_parser.add_argument('-m', '--message', help='Commit message')
-    git_commit_parser.add_argument('--amend', action='store_true', help='Amend the previous commit')
-    git_commit_parser.add_argument('--skip-checks', action='store_true', help='Skip pre-commit checks')
-    git_commit_parser.add_argument('--skip-format-check', action='store_true', help='Skip formatting check')
-    git_commit_parser.add_argument('--skip-build-check', action='store_true', help='Skip build check')
-    git_commit_parser.add_argument('--force', action='store_true', help='Force commit even if checks fail')
-    
-    git_clean_parser = subparsers.add_parser('git-clean', help='Clean git repository and build artifacts')
-    git_clean_parser.add_argument('--force', action='store_true', help='Actually clean files (default is dry-run)')
-    git_clean_parser.add_argument('--interactive', action='store_true', help='Interactive clean mode')
-    git_clean_parser.add_argument('--include-directories', action='store_true', help='Also clean untracked directories')
-    git_clean_parser.add_argument('--include-ignored', action='store_true', help='Also clean ignored files')
-    git_clean_parser.add_argument('--include-build-artifacts', action='store_true', help='Also clean build artifacts')
-    
-    # Performance and Analysis Commands
-    build_stats_parser = subparsers.add_parser('build-stats', help='Display build statistics and performance analysis')
-    
-    cache_mgmt_parser = subparsers.add_parser('cache-mgmt', help='Manage build caches and temporary files')
-    cache_mgmt_parser.add_argument('--clean-cmake', action='store_true', help='Clean CMake cache files')
-    cache_mgmt_parser.add_argument('--clean-deps', action='store_true', help='Clean dependency cache files')
-    cache_mgmt_parser.add_argument('--optimize', action='store_true', help='Optimize cache storage')
+    names = [command] if command in _COMMANDS else _COMMANDS
+    for name in names:
+        help_text, add_arguments, _ = _COMMANDS[name]
+        subparser = subparsers.add_parser(name, help=help_text)
+        if add_arguments:
+            add_arguments(subparser)
     
     return parser
 
 
 def main():
     """Main entry point."""
-    parser = create_parser()
+    parser = create_parser(sys.argv[1] if len(sys.argv) > 1 else None)
     args = parser.parse_args()
     
     if not args.command:
@@ -2874,32 +3590,8 @@ def main():
         
     orchestrator = BuildOrchestrator()
     
-    # Map commands to methods
-    command_map = {
-        'setup': orchestrator.cmd_setup,
-        'info': orchestrator.cmd_info,
-        'configure': orchestrator.cmd_configure,
-        'build': orchestrator.cmd_build,
-        'clean': orchestrator.cmd_clean,
-        'test': orchestrator.cmd_test,
-        'format': orchestrator.cmd_format,
-        'lint': orchestrator.cmd_lint,
-        'full-lint': orchestrator.cmd_full_lint,
-        'compile-db': orchestrator.cmd_compile_db,
-        'install-git-hooks': orchestrator.cmd_install_git_hooks,
-        'rebuild': orchestrator.cmd_rebuild,
-        'reconfigure': orchestrator.cmd_reconfigure,
-        'git-status': orchestrator.cmd_git_status,
-        'git-pull': orchestrator.cmd_git_pull,
-        'git-push': orchestrator.cmd_git_push,
-        'git-commit': orchestrator.cmd_git_commit,
-        'git-clean': orchestrator.cmd_git_clean,
-        'build-stats': orchestrator.cmd_build_stats,
-        'cache-mgmt': orchestrator.cmd_cache_management,
-    }
-    
     try:
-        command_func = command_map[args.command]
+        command_func = getattr(orchestrator, _COMMANDS[args.command][2])
         orchestrator.start_timing()
         result = command_func(args)
         orchestrator.print_execution_time(f"Command '{args.command}'")